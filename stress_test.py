@@ -18,44 +18,74 @@ Test modules are organized in tests/stress/:
 - runner.py: Orchestrates all test modules
 
 Usage:
-    python stress_test.py [project_name] [project_root]
+    python stress_test.py [project_name] [project_root] [--quiet]
+
+    --quiet: on a run with no failures, print a single summary line and skip
+             writing the results file (CI pass/fail usage)
+
+The suite runs on uvloop when it is installed, and on the default asyncio
+loop otherwise.
 
 Examples:
     python stress_test.py ai-gateway-mcp
     python stress_test.py my-project /path/to/project
+    python stress_test.py ai-gateway-mcp --quiet
 """
 
 import asyncio
 import sys
 from pathlib import Path
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Add tests directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from tests.stress.runner import StressTestRunner
+from tests.stress.runner import BAR_EQ, HEADER_BANNER, StressTestRunner
 
 
 async def main():
     """Main entry point for stress tests."""
     # Parse command line arguments
-    project_name = sys.argv[1] if len(sys.argv) > 1 else "ai-gateway-mcp"
-    project_root = sys.argv[2] if len(sys.argv) > 2 else None
-
-    print(f"\n{'='*80}")
-    print(f"{'STRUCTURAL QUERY STRESS TEST':^80}")
-    print(f"{'='*80}")
-    print(f"  Project: {project_name}")
-    print(f"  Root: {project_root or 'current directory'}")
-    print(f"  Focus: Structural graph queries only")
-    print(f"  Tools: 7 structural query tools + expert mode")
-    print(f"{'='*80}\n")
+    quiet = "--quiet" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--quiet"]
+    project_name = args[0] if len(args) > 0 else "ai-gateway-mcp"
+    project_root = args[1] if len(args) > 1 else None
+
+    sys.stdout.write(
+        f"\n{BAR_EQ}\n"
+        f"{HEADER_BANNER}\n"
+        f"{BAR_EQ}\n"
+        f"  Project: {project_name}\n"
+        f"  Root: {project_root or 'current directory'}\n"
+        f"  Focus: Structural graph queries only\n"
+        f"  Tools: 7 structural query tools + expert mode\n"
+        f"{BAR_EQ}\n\n"
+    )
 
     # Run stress tests
-    runner = StressTestRunner(project_name=project_name, project_root=project_root)
+    runner = StressTestRunner(
+        project_name=project_name, project_root=project_root, quiet=quiet
+    )
     success = await runner.run_all_tests()
 
+    if success and quiet and runner.results["summary"]["failed"] == 0:
+        summary = runner.results["summary"]
+        sys.stdout.write(
+            f"✅ {summary['passed']}/{summary['total_tests']} passed, "
+            f"{summary['partial']} partial, 0 failed "
+            f"in {summary['execution_time_seconds']:.2f}s\n"
+        )
+        return 0
+
     if success:
-        output_file = runner.save_results()
+        output_file = await runner.save_results()
         runner.print_summary(output_file)
         return 0
     else:
@@ -64,5 +94,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    exit_code = asyncio.run(main(), loop_factory=loop_factory)
     sys.exit(exit_code)
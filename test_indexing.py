@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """Manual test script to verify code-graph indexing and semantic search."""
 
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the project to the path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 from weavr.config import settings
 from weavr.embedder import embed_code
@@ -13,6 +18,50 @@ from weavr.services.graph_service import MemgraphIngestor
 from weavr.tools.semantic_search import semantic_code_search, get_function_source_code
 
 
+class ThreadCapturedStdout(io.TextIOBase):
+    """stdout proxy that diverts writes from capturing threads into per-thread buffers.
+
+    Lets independent tests run concurrently while their output is still
+    reported in order, one test at a time.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._target).write(s)
+
+    def flush(self):
+        self._target.flush()
+
+    def capture(self, fn, *args):
+        """Run fn(*args) with its output buffered; return (result, output)."""
+        buffer = self._local.buffer = io.StringIO()
+        try:
+            return fn(*args), buffer.getvalue()
+        except BaseException:
+            self._target.write(buffer.getvalue())
+            raise
+        finally:
+            self._local.buffer = None
+
+
+def run_stage(pool, stdout, *calls):
+    """Run independent (fn, *args) calls concurrently, replaying output in call order."""
+    futures = [pool.submit(stdout.capture, fn, *args) for fn, *args in calls]
+    results = []
+    for future in futures:
+        result, output = future.result()
+        stdout.write(output)
+        results.append(result)
+    return results
+
+
 def test_basic_graph_query():
     """Test 1: Basic graph query to verify data is indexed."""
     print("=" * 80)
@@ -25,23 +74,20 @@ def test_basic_graph_query():
         batch_size=100,
         project_name="weavr"
     ) as ingestor:
-        # Count total nodes
-        count_query = "MATCH (n) RETURN count(n) AS total"
-        result = ingestor._execute_query(count_query, {})
-        total_nodes = result[0]["total"] if result else 0
-        print(f"✓ Total nodes in graph: {total_nodes}")
-
-        # Count functions
-        func_query = "MATCH (n:Function) RETURN count(n) AS total"
-        result = ingestor._execute_query(func_query, {})
-        total_functions = result[0]["total"] if result else 0
-        print(f"✓ Total functions: {total_functions}")
-
-        # Count classes
-        class_query = "MATCH (n:Class) RETURN count(n) AS total"
-        result = ingestor._execute_query(class_query, {})
-        total_classes = result[0]["total"] if result else 0
-        print(f"✓ Total classes: {total_classes}")
+        # All three counts in one round-trip
+        stats_query = """
+        MATCH (n)
+        WITH count(n) AS total_nodes
+        OPTIONAL MATCH (c:Class)
+        WITH total_nodes, count(c) AS total_classes
+        OPTIONAL MATCH (f:Function)
+        RETURN total_nodes, count(f) AS total_functions, total_classes
+        """
+        rows = ingestor._execute_query(stats_query, {})
+        stats = rows[0] if rows else {}
+        total_nodes = stats.get("total_nodes", 0)
+        total_functions = stats.get("total_functions", 0)
+        total_classes = stats.get("total_classes", 0)
 
         # Get sample function
         sample_query = """
@@ -50,6 +96,10 @@ def test_basic_graph_query():
         LIMIT 3
         """
         results = ingestor._execute_query(sample_query, {})
+        print(f"✓ Total nodes in graph: {total_nodes}")
+        print(f"✓ Total functions: {total_functions}")
+        print(f"✓ Total classes: {total_classes}")
+
         print(f"\n✓ Sample functions:")
         for r in results:
             print(f"  - {r['name']} (node_id: {r['node_id']})")
@@ -156,22 +206,30 @@ def main():
     # Run tests
     results = {}
 
-    # Test 1: Basic graph query
-    graph_ok, sample_node_id = test_basic_graph_query()
-    results["Basic Graph Query"] = graph_ok
-
-    # Test 2: Embedding generation
-    embedding_ok = test_embedding_generation()
-    results["Embedding Generation"] = embedding_ok
-
-    # Test 3: Semantic search
-    search_ok = test_semantic_search()
-    results["Semantic Search"] = search_ok
-
-    # Test 4: Code retrieval (if we have a node ID)
-    if sample_node_id:
-        retrieval_ok = test_code_retrieval(sample_node_id)
-        results["Code Retrieval"] = retrieval_ok
+    # Tests only share the graph read-only, so each stage's tests overlap their network I/O.
+    # Test 4 needs the sample node from Test 1, so it runs in the second stage.
+    real_stdout = sys.stdout
+    stdout = ThreadCapturedStdout(real_stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Test 1: Basic graph query / Test 2: Embedding generation
+            (graph_ok, sample_node_id), embedding_ok = run_stage(
+                pool, stdout, (test_basic_graph_query,), (test_embedding_generation,)
+            )
+            results["Basic Graph Query"] = graph_ok
+            results["Embedding Generation"] = embedding_ok
+
+            # Test 3: Semantic search / Test 4: Code retrieval (if we have a node ID)
+            stage = [(test_semantic_search,)]
+            if sample_node_id:
+                stage.append((test_code_retrieval, sample_node_id))
+            search_ok, *retrieval = run_stage(pool, stdout, *stage)
+            results["Semantic Search"] = search_ok
+            if retrieval:
+                results["Code Retrieval"] = retrieval[0]
+    finally:
+        sys.stdout = real_stdout
 
     # Print summary
     print("\n" + "=" * 80)
@@ -2,13 +2,74 @@
 """Test that Project-based isolation works correctly in Community Edition."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 from weavr.config import settings
 from weavr.services.graph_service import MemgraphIngestor
 
+# Node rows per project, grouped by label so each label flushes as one UNWIND batch
+PROJECT_NODES = {
+    "test-project-a": {
+        "Module": [
+            {
+                "qualified_name": "test-project-a.module_a",
+                "name": "module_a",
+                "path": "/path/to/module_a.py",
+            }
+        ],
+        "Function": [
+            {
+                "qualified_name": "test-project-a.module_a.func_a",
+                "name": "func_a",
+                "start_line": 1,
+                "end_line": 5,
+            }
+        ],
+    },
+    "test-project-b": {
+        "Module": [
+            {
+                "qualified_name": "test-project-b.module_b",
+                "name": "module_b",
+                "path": "/path/to/module_b.py",
+            }
+        ],
+        "Function": [
+            {
+                "qualified_name": "test-project-b.module_b.func_b",
+                "name": "func_b",
+                "start_line": 1,
+                "end_line": 5,
+            }
+        ],
+    },
+}
+
+
+def write_project_nodes(ingestor: MemgraphIngestor, project_name: str) -> None:
+    """Buffer the Project node and its rows, then flush everything in one pass."""
+    ingestor.ensure_node_batch("Project", {"name": project_name})
+    for label, rows in PROJECT_NODES[project_name].items():
+        for row in rows:
+            ingestor.ensure_node_batch(label, row)
+    ingestor.flush_all()
+
+
+def setup_project(project_name: str) -> None:
+    """Open a dedicated ingestor for one project and write its nodes."""
+    with MemgraphIngestor(
+        host=settings.MEMGRAPH_HOST,
+        port=settings.MEMGRAPH_PORT,
+        batch_size=100,
+        project_name=project_name
+    ) as ingestor:
+        write_project_nodes(ingestor, project_name)
+
 
 def test_project_isolation():
     """Test that nodes from different projects are isolated via Project CONTAINS relationships."""
@@ -19,58 +80,24 @@ def test_project_isolation():
     with MemgraphIngestor(
         host=settings.MEMGRAPH_HOST,
         port=settings.MEMGRAPH_PORT,
-        batch_size=10,
-        project_name="test-project-a"
-    ) as ingestor_a:
+        project_name="__all__"
+    ) as ingestor:
         # Clean database
         print("\n1. Cleaning database...")
-        ingestor_a.clean_database()
-        ingestor_a.ensure_constraints()
-
-        # Create Project A
-        print("2. Creating Project A...")
-        ingestor_a.ensure_node_batch("Project", {"name": "test-project-a"})
-
-        # Create some nodes for Project A
-        print("3. Creating nodes for Project A...")
-        ingestor_a.ensure_node_batch("Module", {
-            "qualified_name": "test-project-a.module_a",
-            "name": "module_a",
-            "path": "/path/to/module_a.py"
-        })
-        ingestor_a.ensure_node_batch("Function", {
-            "qualified_name": "test-project-a.module_a.func_a",
-            "name": "func_a",
-            "start_line": 1,
-            "end_line": 5
-        })
-        ingestor_a.flush_all()
-
-    # Now use a different project
-    with MemgraphIngestor(
-        host=settings.MEMGRAPH_HOST,
-        port=settings.MEMGRAPH_PORT,
-        batch_size=10,
-        project_name="test-project-b"
-    ) as ingestor_b:
-        # Create Project B
-        print("4. Creating Project B...")
-        ingestor_b.ensure_node_batch("Project", {"name": "test-project-b"})
-
-        # Create some nodes for Project B
-        print("5. Creating nodes for Project B...")
-        ingestor_b.ensure_node_batch("Module", {
-            "qualified_name": "test-project-b.module_b",
-            "name": "module_b",
-            "path": "/path/to/module_b.py"
-        })
-        ingestor_b.ensure_node_batch("Function", {
-            "qualified_name": "test-project-b.module_b.func_b",
-            "name": "func_b",
-            "start_line": 1,
-            "end_line": 5
-        })
-        ingestor_b.flush_all()
+        ingestor.clean_database()
+        ingestor.ensure_constraints()
+
+    # The two projects are independent, so write them over separate connections at once
+    print("2. Creating Project A...")
+    print("3. Creating nodes for Project A...")
+    print("4. Creating Project B...")
+    print("5. Creating nodes for Project B...")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for future in [
+            pool.submit(setup_project, "test-project-a"),
+            pool.submit(setup_project, "test-project-b"),
+        ]:
+            future.result()
 
     # Verify isolation
     print("\n6. Verifying isolation...")
@@ -79,55 +106,54 @@ def test_project_isolation():
         port=settings.MEMGRAPH_PORT,
         project_name="__all__"  # Query across all projects for verification
     ) as ingestor:
-        # Count total Projects
-        result = ingestor.fetch_all("MATCH (p:Project) RETURN count(p) AS count")
-        project_count = result[0]["count"]
+        # One round-trip: project total plus per-project, per-label node counts. The
+        # OPTIONAL MATCH keeps a row (label null, count 0) for a project with no
+        # contained nodes, so project_count still comes back
+        rows = ingestor.fetch_all(
+            """
+            MATCH (proj:Project)
+            WITH count(proj) AS project_count
+            UNWIND $projects AS pname
+            OPTIONAL MATCH (p:Project {name: pname})-[:CONTAINS*]->(n)
+            RETURN project_count, pname, labels(n)[0] AS label,
+                   count(DISTINCT n) AS cnt,
+                   collect(DISTINCT n.qualified_name) AS qns
+            """,
+            {"projects": list(PROJECT_NODES)},
+        )
+        project_count = rows[0]["project_count"] if rows else 0
+        per_project: dict[str, dict[str, dict]] = {name: {} for name in PROJECT_NODES}
+        for row in rows:
+            per_project[row["pname"]][row["label"]] = row
+
         print(f"   ✓ Total Projects: {project_count}")
         assert project_count == 2, f"Expected 2 projects, got {project_count}"
 
-        # Count Project A's nodes
-        result = ingestor.fetch_all("""
-            MATCH (p:Project {name: 'test-project-a'})-[:CONTAINS]->(n)
-            RETURN count(n) AS count
-        """)
-        project_a_nodes = result[0]["count"]
+        project_a = per_project["test-project-a"]
+        project_b = per_project["test-project-b"]
+
+        project_a_nodes = sum(r["cnt"] for r in project_a.values())
         print(f"   ✓ Project A nodes: {project_a_nodes}")
         assert project_a_nodes == 2, f"Expected 2 nodes for Project A, got {project_a_nodes}"
 
-        # Count Project B's nodes
-        result = ingestor.fetch_all("""
-            MATCH (p:Project {name: 'test-project-b'})-[:CONTAINS]->(n)
-            RETURN count(n) AS count
-        """)
-        project_b_nodes = result[0]["count"]
+        project_b_nodes = sum(r["cnt"] for r in project_b.values())
         print(f"   ✓ Project B nodes: {project_b_nodes}")
         assert project_b_nodes == 2, f"Expected 2 nodes for Project B, got {project_b_nodes}"
 
         # Query only Project A's functions
-        result = ingestor.fetch_all("""
-            MATCH (p:Project {name: 'test-project-a'})-[:CONTAINS*]->(f:Function)
-            RETURN f.qualified_name AS qn
-        """)
-        print(f"   ✓ Project A functions: {[r['qn'] for r in result]}")
-        assert len(result) == 1, f"Expected 1 function for Project A, got {len(result)}"
-        assert result[0]["qn"] == "test-project-a.module_a.func_a"
+        functions_a = project_a.get("Function", {}).get("qns", [])
+        print(f"   ✓ Project A functions: {functions_a}")
+        assert len(functions_a) == 1, f"Expected 1 function for Project A, got {len(functions_a)}"
+        assert functions_a[0] == "test-project-a.module_a.func_a"
 
         # Query only Project B's functions
-        result = ingestor.fetch_all("""
-            MATCH (p:Project {name: 'test-project-b'})-[:CONTAINS*]->(f:Function)
-            RETURN f.qualified_name AS qn
-        """)
-        print(f"   ✓ Project B functions: {[r['qn'] for r in result]}")
-        assert len(result) == 1, f"Expected 1 function for Project B, got {len(result)}"
-        assert result[0]["qn"] == "test-project-b.module_b.func_b"
+        functions_b = project_b.get("Function", {}).get("qns", [])
+        print(f"   ✓ Project B functions: {functions_b}")
+        assert len(functions_b) == 1, f"Expected 1 function for Project B, got {len(functions_b)}"
+        assert functions_b[0] == "test-project-b.module_b.func_b"
 
         # Verify cross-project queries don't mix data
-        result = ingestor.fetch_all("""
-            MATCH (p:Project {name: 'test-project-a'})-[:CONTAINS*]->(f:Function)
-            WHERE f.qualified_name CONTAINS 'project-b'
-            RETURN count(f) AS count
-        """)
-        cross_contamination = result[0]["count"]
+        cross_contamination = sum("project-b" in qn for qn in functions_a)
         print(f"   ✓ Cross-project contamination: {cross_contamination}")
         assert cross_contamination == 0, "Projects should not share nodes!"
 
@@ -1,19 +1,131 @@
 """Base class for stress tests."""
 
+import asyncio
+import functools
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, NamedTuple, TypedDict
 
-try:
-    from loguru import logger
-except ImportError:
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
+import mgclient
+
+
+@functools.cache
+def _get_logger() -> Any:
+    """Return loguru's logger, or a stdlib logger when loguru is missing."""
+    try:
+        from loguru import logger
+    except ImportError:
+        import logging
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger(__name__)
+    return logger
+
+
+@dataclass(slots=True)
+class StressResult:
+    """Outcome of a single stress test.
+
+    The runner normalizes every test's result to this class, so summary code
+    reads ``status`` as an attribute; ``to_dict`` produces the serialized form.
+    """
+
+    status: str
+    response_time_ms: int | None = 0
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StressResult":
+        """Build a result from a plain result dict such as the PERF tests return.
+
+        A missing ``response_time_ms`` stays missing in ``to_dict``.
+        """
+        extra = {
+            k: v for k, v in data.items() if k not in ("status", "response_time_ms")
+        }
+        return cls(data["status"], data.get("response_time_ms"), extra or None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up an extra field by name, like ``dict.get``."""
+        if self.extra is None:
+            return default
+        return self.extra.get(key, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten into the ``{"status", "response_time_ms", **extra}`` dict."""
+        result: dict[str, Any] = {"status": self.status}
+        if self.response_time_ms is not None:
+            result["response_time_ms"] = self.response_time_ms
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class QueryResult(TypedDict, total=False):
+    """The parts of a structural tool's response the stress checks read."""
+
+    error: str
+    error_code: str
+    suggestion: str
+    metadata: dict[str, Any]
+    results: list[Any]
+    circular_dependencies: list[Any]
+
+
+class StressCase(NamedTuple):
+    """One table-driven tool call and how to judge its outcome.
+
+    ``kwargs`` builds the handler arguments from the running test, ``check``
+    turns the handler's result into result fields (``status`` plus extras;
+    ``notes`` defaults to the case's), and ``on_error`` holds the fields
+    recorded when the handler raises.
+    """
+
+    id: str
+    desc: str
+    tool: str
+    kwargs: Callable[[Any], dict[str, Any]]
+    check: Callable[[QueryResult], dict[str, Any]]
+    notes: str
+    on_error: dict[str, Any]
+    error_notes: str
+
+
+# Response keys that mark a tool result as an error
+_ERROR_KEYS = frozenset({"error", "error_code"})
+
+
+def is_error(result: QueryResult) -> bool:
+    """Return whether a tool result carries any error key."""
+    return not result.keys().isdisjoint(_ERROR_KEYS)
+
+
+def error_text(result: Any, limit: int | None = 100) -> str:
+    """Return a tool result's ``error`` string cut to ``limit`` chars, or ``""``."""
+    error = result.get("error") if isinstance(result, dict) else None
+    return error[:limit] if isinstance(error, str) else ""
+
+
+# Ways a tool call can legitimately fail; run_concurrently reports anything else
+CASE_ERRORS = (
+    TypeError,
+    ValueError,
+    AttributeError,
+    TimeoutError,
+    mgclient.DatabaseError,
+)
+
+# on_error fields for most cases: a raise either fails the case or is the expected one
+ERROR_FAILS = {"status": "fail", "handled_gracefully": False}
+ERROR_REJECTS = {"status": "pass", "handled_gracefully": True}
 
 
 class BaseStressTest:
     """Base class for all stress tests providing common utilities."""
 
+    # Tool handlers resolved once at construction; subclasses list the ones they call
+    HANDLER_NAMES: tuple[str, ...] = ()
+
     def __init__(self, project_name: str, tools: Any, ingestor: Any):
         """Initialize base stress test.
 
@@ -25,13 +137,31 @@ class BaseStressTest:
         self.project_name = project_name
         self.tools = tools
         self.ingestor = ingestor
+        # Qualified names of the benchmark fixtures most tests query
+        self._qn_benchmark_models = f"{project_name}.scripts.benchmark.benchmark_models"
+        self._qn_main = f"{self._qn_benchmark_models}.main"
+        self._qn_parse_args = f"{self._qn_benchmark_models}.parse_args"
+        self._qn_api_client = f"{project_name}.scripts.benchmark.utils.api_client"
+        self._qn_apierror = f"{self._qn_api_client}.APIError"
+        self._prepare_handlers()
+
+    def _prepare_handlers(self) -> None:
+        """Resolve every handler in ``HANDLER_NAMES`` once, up front.
+
+        Unknown tools are left out so the test using them fails on its own.
+        """
+        self._handlers: dict[str, Any] = {}
+        for name in self.HANDLER_NAMES:
+            entry = self.tools.get_tool_handler(name)
+            if entry is not None:
+                self._handlers[name] = entry[0]
 
     def create_result(
         self,
         status: str,
         response_time_ms: int = 0,
         **kwargs: Any
-    ) -> dict[str, Any]:
+    ) -> StressResult:
         """Create a standardized test result.
 
         Args:
@@ -40,14 +170,75 @@ class BaseStressTest:
             **kwargs: Additional result fields
 
         Returns:
-            Standardized test result dictionary
+            Standardized test result
         """
-        result = {
-            "status": status,
-            "response_time_ms": response_time_ms,
-        }
-        result.update(kwargs)
-        return result
+        return StressResult(status, response_time_ms, kwargs or None)
+
+    async def run_concurrently(
+        self, tests: dict[str, Callable[[], Awaitable[StressResult]]]
+    ) -> dict[str, StressResult]:
+        """Run independent test coroutines together, keyed by test ID.
+
+        A test that raises instead of returning a result is logged and
+        recorded as failed, so one broken test never hides the others.
+
+        Args:
+            tests: Mapping of test IDs to zero-argument test coroutines
+
+        Returns:
+            Dictionary mapping test IDs to test results, in ``tests`` order
+        """
+        outcomes = await asyncio.gather(
+            *(run() for run in tests.values()), return_exceptions=True
+        )
+        results = {}
+        for test_id, outcome in zip(tests, outcomes):
+            if isinstance(outcome, BaseException):
+                self.log_error(test_id, outcome)
+                outcome = self.create_result(
+                    status="fail",
+                    handled_gracefully=False,
+                    error_message=str(outcome)[:100],
+                    notes="Test raised unexpectedly",
+                )
+            results[test_id] = outcome
+        return results
+
+    async def run_cases(self, cases: Iterable[StressCase]) -> dict[str, StressResult]:
+        """Run table-driven cases concurrently, keyed by case ID.
+
+        Args:
+            cases: Cases to run, in reporting order
+
+        Returns:
+            Dictionary mapping test IDs to test results
+        """
+        return await self.run_concurrently(
+            {case.id: functools.partial(self._run_case, case) for case in cases}
+        )
+
+    async def _run_case(self, case: StressCase) -> StressResult:
+        self.log_test(case.id, case.desc)
+        start = time.perf_counter_ns()
+        try:
+            try:
+                result = await self._handlers[case.tool](**case.kwargs(self))
+            finally:
+                latency_us = (time.perf_counter_ns() - start) // 1000
+            fields = case.check(result)
+        except CASE_ERRORS as e:
+            if case.on_error["status"] == "fail":
+                self.log_error(case.id, e)
+            fields = {
+                **case.on_error,
+                "error_message": str(e)[:100],
+                "notes": case.error_notes,
+            }
+        else:
+            fields.setdefault("notes", case.notes)
+        fields["latency_us"] = latency_us
+        # The fields dict becomes the result's extras as-is, with no kwargs round-trip
+        return StressResult(fields.pop("status"), 0, fields)
 
     async def run_with_timing(self, coro):
         """Run a coroutine and return result with timing.
@@ -58,14 +249,9 @@ class BaseStressTest:
         Returns:
             Tuple of (result, elapsed_ms)
         """
-        start = time.time()
-        try:
-            result = await coro
-            elapsed = int((time.time() - start) * 1000)
-            return result, elapsed
-        except Exception as e:
-            elapsed = int((time.time() - start) * 1000)
-            raise
+        start = time.perf_counter_ns()
+        result = await coro
+        return result, (time.perf_counter_ns() - start) // 1_000_000
 
     def log_test(self, test_id: str, description: str):
         """Log test execution.
@@ -74,7 +260,7 @@ class BaseStressTest:
             test_id: Test identifier
             description: Test description
         """
-        logger.info(f"Running {test_id}: {description}")
+        _get_logger().info(f"Running {test_id}: {description}")
 
     def log_error(self, test_id: str, error: Exception):
         """Log test error.
@@ -83,7 +269,7 @@ class BaseStressTest:
             test_id: Test identifier
             error: Exception that occurred
         """
-        logger.error(f"Test {test_id} failed: {str(error)[:100]}")
+        _get_logger().error(f"Test {test_id} failed: {str(error)[:100]}")
 
     async def get_test_results(self) -> dict[str, Any]:
         """Run all tests in this test class.
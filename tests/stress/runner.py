@@ -1,17 +1,27 @@
 """Stress test runner that orchestrates all test modules."""
 
+import asyncio
+import gzip
 import json
 import os
+import shutil
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 try:
     from loguru import logger
@@ -25,43 +35,205 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from weavr.mcp.tools import create_mcp_tools_registry
 from weavr.services.graph_service import MemgraphIngestor
+from tests.stress.base import StressResult
 from tests.stress.test_structural_queries import StructuralQueriesTest
 from tests.stress.test_parameter_validation import ParameterValidationTest
 from tests.stress.test_edge_cases import EdgeCasesTest
 from tests.stress.test_performance import PerformanceTest
 from tests.stress.test_concurrent_operations import ConcurrentOperationsTest
 
+BAR_EQ = "=" * 80
+BAR_DASH = "-" * 80
+HEADER_BANNER = f"{'STRUCTURAL QUERY STRESS TEST':^80}"
+HEADER_RESULTS = f"{'STRUCTURAL QUERY STRESS TEST RESULTS':^80}"
+HEADER_STATISTICS = f"{'OVERALL STATISTICS':^80}"
+HEADER_CATEGORIES = f"{'TEST CATEGORIES':^80}"
+HEADER_STRENGTHS = f"{'STRENGTHS':^80}"
+HEADER_WEAKNESSES = f"{'WEAKNESSES':^80}"
+HEADER_RECOMMENDATIONS = f"{'RECOMMENDATIONS':^80}"
+
+SUMMARY_TEMPLATE = f"""
+{BAR_EQ}
+{HEADER_RESULTS}
+{BAR_EQ}
+
+✅ Stress test completed successfully!
+📊 Results saved to: {{output_file}}
+
+{HEADER_STATISTICS}
+{BAR_DASH}
+  Total tests run:    {{total_tests}}
+  ✅ Passed:          {{passed}}
+  ⚠️  Partial:         {{partial}}
+  ❌ Failed:          {{failed}}
+  📈 Pass rate:       {{pass_rate}}
+  ⏱️  Execution time:  {{execution_time_seconds:.2f}}s
+
+{HEADER_CATEGORIES}
+{BAR_DASH}
+{{categories}}
+{HEADER_STRENGTHS}
+{BAR_DASH}
+{{strengths}}
+{HEADER_WEAKNESSES}
+{BAR_DASH}
+{{weaknesses}}
+{HEADER_RECOMMENDATIONS}
+{BAR_DASH}
+{{recommendations}}
+{BAR_EQ}
+For detailed results, see: {{output_file}}
+{BAR_EQ}
+
+"""
+
+COMPRESS_THRESHOLD_BYTES = 1_000_000
+
+OUTPUT_DIR = (Path(__file__).parent.parent.parent / "infrastructure" / "benchmarks").resolve()
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _format_category_line(category: str, stats: Any) -> str:
+    """Format one TEST CATEGORIES row of the console summary."""
+    if not isinstance(stats, dict):
+        return ""
+    if not stats.get("total"):
+        return ""
+    category_name = category.replace('_', ' ').title()
+    if "passed" in stats:
+        return f"  {category_name:.<45} {stats['passed']}/{stats['total']} passed\n"
+    if "targets_met" in stats:
+        return f"  {category_name:.<45} {stats['targets_met']}/{stats['total']} targets met\n"
+    return ""
+
+
+def _format_numbered(items: list[str]) -> str:
+    """Format a numbered console list, one item per line."""
+    return "".join(f"  {i}. {item}\n" for i, item in enumerate(items, 1))
+
+
+def _tally(tests: dict[str, StressResult]) -> dict[str, int]:
+    """Count statuses and target flags for one category in a single pass."""
+    counts = {
+        "total": len(tests),
+        "passed": 0,
+        "partial": 0,
+        "failed": 0,
+        "performance_target_met": 0,
+        "target_met": 0,
+    }
+    for t in tests.values():
+        status = t.status
+        if status == "pass":
+            counts["passed"] += 1
+        elif status == "partial":
+            counts["partial"] += 1
+        else:
+            counts["failed"] += 1
+        if t.get("performance_target_met"):
+            counts["performance_target_met"] += 1
+        if t.get("target_met"):
+            counts["target_met"] += 1
+    return counts
+
+
+def _dumps_line(record: dict[str, Any]) -> bytes:
+    """Encode one NDJSON record, newline included."""
+    if HAS_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record).encode() + b"\n"
+
+
+def _dumps_indented(value: Any, depth: int) -> bytes:
+    """Encode ``value`` as 2-space indented JSON nested ``depth`` levels deep."""
+    if HAS_ORJSON:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(value, indent=2).encode()
+    return data.replace(b"\n", b"\n" + b"  " * depth)
+
+
+def _stream_results_json(f: Any, results: dict[str, Any]) -> None:
+    """Write ``results`` as indented JSON one category at a time.
+
+    Produces the same bytes as dumping the whole (flattened) dict at once,
+    but only one category is ever encoded in memory.
+    """
+    f.write(b"{")
+    for i, (key, value) in enumerate(results.items()):
+        f.write(b"," if i else b"")
+        f.write(b"\n  " + _dumps_indented(key, 1) + b": ")
+        if key != "results" or not value:
+            f.write(_dumps_indented(value, 1))
+            continue
+        f.write(b"{")
+        for j, (category, tests) in enumerate(value.items()):
+            flat = {
+                test_id: r.to_dict() for test_id, r in tests.items()
+            }
+            f.write(b"," if j else b"")
+            f.write(b"\n    " + _dumps_indented(category, 2) + b": " + _dumps_indented(flat, 2))
+        f.write(b"\n  }")
+    f.write(b"\n}" if results else b"}")
+
+
+def _serializable(results: dict[str, Any]) -> dict[str, Any]:
+    """Return ``results`` with every StressResult flattened to a dict."""
+    return {
+        **results,
+        "results": {
+            category: {test_id: r.to_dict() for test_id, r in tests.items()}
+            for category, tests in results["results"].items()
+        },
+    }
+
 
 class StressTestRunner:
     """Orchestrates all stress test modules."""
 
-    def __init__(self, project_name: str = "ai-gateway-mcp", project_root: str | None = None):
+    def __init__(
+        self,
+        project_name: str = "ai-gateway-mcp",
+        project_root: str | None = None,
+        quiet: bool = False,
+    ):
         """Initialize stress test runner.
 
         Args:
             project_name: Name of the project to test (must be indexed in Memgraph)
             project_root: Root directory of the project (defaults to cwd)
+            quiet: Skip strengths/weaknesses/recommendations when no test failed
         """
         self.project_name = project_name
         self.project_root = project_root or str(Path.cwd())
+        self.quiet = quiet
         self.results = {
             "metadata": {},
             "results": {},
             "summary": {},
         }
         self.start_time = None
+        self.run_date = None
+        self.stream_file = None
         self.ingestor = None
         self.tools = None
+        self.tool_names: tuple[str, ...] = ()
 
     async def setup(self) -> bool:
         """Set up test environment."""
         try:
             logger.info("Setting up stress test environment...")
 
+            now = datetime.now()
+            self.run_date = now.strftime("%Y-%m-%d")
+            host = os.getenv("MEMGRAPH_HOST", "localhost")
+            port = int(os.getenv("MEMGRAPH_PORT", 7687))
+            pool_size = int(os.getenv("MEMGRAPH_POOL", ConcurrentOperationsTest.POOL_SIZE_DEFAULT))
+
             # Initialize services
             self.ingestor = MemgraphIngestor(
-                host=os.getenv("MEMGRAPH_HOST", "localhost"),
-                port=int(os.getenv("MEMGRAPH_PORT", 7687)),
+                host=host,
+                port=port,
                 project_name=self.project_name,
             )
 
@@ -77,23 +249,26 @@ class StressTestRunner:
 
             # Get graph statistics
             node_count_result = self.ingestor.fetch_all(
-                f"MATCH (p:Project {{name: '{self.project_name}'}})-[:CONTAINS]->(n) RETURN count(n) as count"
+                "MATCH (p:Project {name: $name})-[:CONTAINS]->(n) RETURN count(n) as count",
+                {"name": self.project_name},
             )
             node_count = node_count_result[0].get("count", 0) if node_count_result else 0
 
-            # Get tool count
-            tool_count = len(self.tools.list_tool_names())
+            # Materialize the registry's tool names once for the whole run
+            self.tool_names = tuple(self.tools.list_tool_names())
+            tool_count = len(self.tool_names)
 
             # Record metadata
             self.results["metadata"] = {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "time": datetime.now().strftime("%H:%M:%S"),
+                "date": self.run_date,
+                "time": now.strftime("%H:%M:%S"),
                 "project_name": self.project_name,
                 "indexed_nodes": node_count,
                 "available_tools": tool_count,
                 "test_focus": "Structural graph queries only (no NL/semantic/vector search)",
-                "memgraph_host": os.getenv("MEMGRAPH_HOST", "localhost"),
-                "memgraph_port": int(os.getenv("MEMGRAPH_PORT", 7687)),
+                "memgraph_host": host,
+                "memgraph_port": port,
+                "memgraph_pool_size": pool_size,
             }
 
             logger.info(f"Setup complete - Testing project '{self.project_name}' with {node_count} nodes, {tool_count} tools")
@@ -104,130 +279,182 @@ class StressTestRunner:
 
     async def run_all_tests(self) -> bool:
         """Run all stress tests."""
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
 
         if not await self.setup():
             return False
 
-        logger.info("\n" + "="*80)
+        logger.info("\n" + BAR_EQ)
         logger.info("Starting Comprehensive Stress Test Suite")
-        logger.info("="*80 + "\n")
-
-        # Initialize test modules
-        structural_test = StructuralQueriesTest(self.project_name, self.tools, self.ingestor)
-        param_test = ParameterValidationTest(self.project_name, self.tools, self.ingestor)
-        edge_test = EdgeCasesTest(self.project_name, self.tools, self.ingestor)
-        perf_test = PerformanceTest(self.project_name, self.tools, self.ingestor)
-        conc_test = ConcurrentOperationsTest(self.project_name, self.tools, self.ingestor)
-
-        # Run all test categories
-        logger.info("=== Running Structural Query Tests ===")
-        self.results["results"]["structural_queries"] = await structural_test.get_test_results()
-
-        logger.info("\n=== Running Parameter Validation Tests ===")
-        self.results["results"]["parameter_validation"] = await param_test.get_test_results()
-
-        logger.info("\n=== Running Edge Case Tests ===")
-        self.results["results"]["edge_cases"] = await edge_test.get_test_results()
-
-        logger.info("\n=== Running Performance Tests ===")
-        self.results["results"]["performance"] = await perf_test.get_test_results()
-
-        logger.info("\n=== Running Concurrent Operations Tests ===")
-        self.results["results"]["concurrent_operations"] = await conc_test.get_test_results()
+        logger.info(BAR_EQ + "\n")
+
+        # Initialize test modules, in the order results are reported
+        categories = [
+            ("structural_queries", "Structural Query", StructuralQueriesTest),
+            ("parameter_validation", "Parameter Validation", ParameterValidationTest),
+            ("edge_cases", "Edge Case", EdgeCasesTest),
+            ("performance", "Performance", PerformanceTest),
+            ("concurrent_operations", "Concurrent Operations", ConcurrentOperationsTest),
+        ]
+
+        # Correctness categories are independent, so run them together; the
+        # timing categories then run alone, one after another, so no other
+        # category's queries land inside their latency windows. Each category
+        # is appended to the NDJSON log as soon as it finishes
+        timed = {"performance", "concurrent_operations"}
+        self.stream_file = OUTPUT_DIR / f"stress-test-{self.run_date}.ndjson"
+        with open(self.stream_file, "wb") as stream:
+            async def run_category(category: str, label: str, test_cls: type) -> dict[str, Any]:
+                logger.info(f"=== Running {label} Tests ===")
+                test = test_cls(self.project_name, self.tools, self.ingestor)
+                tests = {
+                    test_id: r if isinstance(r, StressResult) else StressResult.from_dict(r)
+                    for test_id, r in (await test.get_test_results()).items()
+                }
+                self._stream_category(stream, category, tests)
+                return tests
+
+            concurrent = [c for c in categories if c[0] not in timed]
+            outcomes = dict(zip(
+                (category for category, _, _ in concurrent),
+                await asyncio.gather(*(run_category(*c) for c in concurrent)),
+            ))
+            for c in categories:
+                if c[0] in timed:
+                    outcomes[c[0]] = await run_category(*c)
+
+        for category, _, _ in categories:
+            self.results["results"][category] = outcomes[category]
 
         # Calculate summary
         self.calculate_summary()
 
+        # A clean quiet run skips save_results, so it keeps no NDJSON log either
+        if self.quiet and self.results["summary"]["failed"] == 0:
+            self.stream_file.unlink(missing_ok=True)
+            self.stream_file = None
+        else:
+            logger.info(f"Per-test results streamed to {self.stream_file}")
+
         return True
 
+    def _stream_category(self, stream: Any, category: str, tests: dict[str, Any]):
+        """Append one NDJSON line per test of a finished category.
+
+        Args:
+            stream: Binary file handle of the NDJSON log
+            category: Category key under ``results``
+            tests: Mapping of test IDs to results for the category
+        """
+        stream.write(b"".join(
+            _dumps_line({
+                "category": category,
+                "test_id": test_id,
+                **r.to_dict(),
+            })
+            for test_id, r in tests.items()
+        ))
+        stream.flush()
+
     def calculate_summary(self):
         """Calculate test summary statistics."""
-        total_tests = 0
-        passed = 0
-        partial = 0
-        failed = 0
-
-        # Count tests in all categories
-        for category, tests in self.results["results"].items():
-            for test_id, test_result in tests.items():
-                total_tests += 1
-                status = test_result.get("status", "fail")
-                if status == "pass":
-                    passed += 1
-                elif status == "partial":
-                    partial += 1
-                else:
-                    failed += 1
+        # One pass over each category collects every count the summary needs
+        tallies = {
+            category: _tally(tests)
+            for category, tests in self.results["results"].items()
+        }
+        total_tests = sum(t["total"] for t in tallies.values())
+        passed = sum(t["passed"] for t in tallies.values())
+        partial = sum(t["partial"] for t in tallies.values())
+        failed = sum(t["failed"] for t in tallies.values())
 
         pass_rate = f"{(passed / total_tests * 100):.1f}%" if total_tests > 0 else "0%"
 
-        # Calculate category-specific stats
-        structural_tests = self.results["results"].get("structural_queries", {})
-        structural_passed = sum(1 for t in structural_tests.values() if t.get("status") == "pass")
-        structural_perf_met = sum(1 for t in structural_tests.values() if t.get("performance_target_met", False))
-
-        param_tests = self.results["results"].get("parameter_validation", {})
-        param_passed = sum(1 for t in param_tests.values() if t.get("status") == "pass")
-
-        edge_tests = self.results["results"].get("edge_cases", {})
-        edge_passed = sum(1 for t in edge_tests.values() if t.get("status") == "pass")
-
-        perf_tests = self.results["results"].get("performance", {})
-        perf_targets_met = sum(1 for t in perf_tests.values() if t.get("target_met", False))
-
-        conc_tests = self.results["results"].get("concurrent_operations", {})
-        conc_passed = sum(1 for t in conc_tests.values() if t.get("status") == "pass")
-
-        # Determine strengths
-        strengths = []
-        if structural_passed >= len(structural_tests) * 0.9:
-            strengths.append(f"Excellent structural query reliability: {structural_passed}/{len(structural_tests)} passed")
-        if structural_perf_met >= len(structural_tests) * 0.8:
-            strengths.append(f"Strong performance: {structural_perf_met}/{len(structural_tests)} met timing targets")
-        if param_passed >= len(param_tests) * 0.9:
-            strengths.append(f"Robust parameter validation: {param_passed}/{len(param_tests)} passed")
-        if edge_passed >= len(edge_tests) * 0.85:
-            strengths.append(f"Excellent edge case handling: {edge_passed}/{len(edge_tests)} passed")
-        if conc_passed >= len(conc_tests) * 0.9:
-            strengths.append(f"Strong concurrent operation support: {conc_passed}/{len(conc_tests)} passed")
-
-        if not strengths:
-            strengths.append("System is functional but has room for improvement")
-
-        # Determine weaknesses
-        weaknesses = []
-        if structural_passed < len(structural_tests) * 0.8:
-            weaknesses.append(f"Structural query reliability needs improvement: {structural_passed}/{len(structural_tests)}")
-        if structural_perf_met < len(structural_tests) * 0.7:
-            weaknesses.append(f"Performance targets not consistently met: {structural_perf_met}/{len(structural_tests)}")
-        if param_passed < len(param_tests) * 0.8:
-            weaknesses.append(f"Parameter validation gaps: {param_passed}/{len(param_tests)}")
-        if edge_passed < len(edge_tests) * 0.75:
-            weaknesses.append(f"Edge case handling needs work: {edge_passed}/{len(edge_tests)}")
-        if conc_passed < len(conc_tests) * 0.8:
-            weaknesses.append(f"Concurrent operation reliability issues: {conc_passed}/{len(conc_tests)}")
-        if failed > total_tests * 0.1:
-            weaknesses.append(f"High failure rate: {failed}/{total_tests} tests failed")
-
-        if not weaknesses:
-            weaknesses.append("No significant weaknesses detected - system is production-ready")
-
-        # Generate recommendations
-        recommendations = []
-        if structural_perf_met < len(structural_tests) * 0.8:
-            recommendations.append("Optimize slow queries - add indexes or cache frequently accessed paths")
-        if param_passed < len(param_tests) * 0.9:
-            recommendations.append("Strengthen input validation - add more parameter checks")
-        if edge_passed < len(edge_tests) * 0.85:
-            recommendations.append("Improve edge case handling - add more defensive checks")
-        if conc_passed < len(conc_tests) * 0.9:
-            recommendations.append("Review concurrent operation handling - check for race conditions")
-        if failed > 0:
-            recommendations.append(f"Investigate {failed} failed tests - review logs for root causes")
-
-        if not recommendations:
-            recommendations.append("System is performing well - continue monitoring and maintain test coverage")
+        # Calculate category-specific stats; run_all_tests always sets every category
+        structural = tallies["structural_queries"]
+        structural_total = structural["total"]
+        structural_passed = structural["passed"]
+        structural_perf_met = structural["performance_target_met"]
+
+        param = tallies["parameter_validation"]
+        param_total = param["total"]
+        param_passed = param["passed"]
+
+        edge = tallies["edge_cases"]
+        edge_total = edge["total"]
+        edge_passed = edge["passed"]
+
+        perf = tallies["performance"]
+        perf_total = perf["total"]
+        perf_targets_met = perf["target_met"]
+
+        conc = tallies["concurrent_operations"]
+        conc_total = conc["total"]
+        conc_passed = conc["passed"]
+
+        # A clean quiet run only reports pass/fail, so skip building the narrative
+        if self.quiet and failed == 0:
+            strengths, weaknesses, recommendations = [], [], []
+        else:
+            # Thresholds are shared by strengths, weaknesses and recommendations;
+            # a category with no tests is skipped rather than judged on 0/0
+            structural_t90, structural_t80, structural_t70 = (
+                structural_total * 0.9, structural_total * 0.8, structural_total * 0.7
+            )
+            param_t90, param_t80 = param_total * 0.9, param_total * 0.8
+            edge_t85, edge_t75 = edge_total * 0.85, edge_total * 0.75
+            conc_t90, conc_t80 = conc_total * 0.9, conc_total * 0.8
+            failed_t10 = total_tests * 0.1
+
+            # Determine strengths
+            strengths = []
+            if structural_total and structural_passed >= structural_t90:
+                strengths.append(f"Excellent structural query reliability: {structural_passed}/{structural_total} passed")
+            if structural_total and structural_perf_met >= structural_t80:
+                strengths.append(f"Strong performance: {structural_perf_met}/{structural_total} met timing targets")
+            if param_total and param_passed >= param_t90:
+                strengths.append(f"Robust parameter validation: {param_passed}/{param_total} passed")
+            if edge_total and edge_passed >= edge_t85:
+                strengths.append(f"Excellent edge case handling: {edge_passed}/{edge_total} passed")
+            if conc_total and conc_passed >= conc_t90:
+                strengths.append(f"Strong concurrent operation support: {conc_passed}/{conc_total} passed")
+
+            if not strengths:
+                strengths.append("System is functional but has room for improvement")
+
+            # Determine weaknesses
+            weaknesses = []
+            if structural_total and structural_passed < structural_t80:
+                weaknesses.append(f"Structural query reliability needs improvement: {structural_passed}/{structural_total}")
+            if structural_total and structural_perf_met < structural_t70:
+                weaknesses.append(f"Performance targets not consistently met: {structural_perf_met}/{structural_total}")
+            if param_total and param_passed < param_t80:
+                weaknesses.append(f"Parameter validation gaps: {param_passed}/{param_total}")
+            if edge_total and edge_passed < edge_t75:
+                weaknesses.append(f"Edge case handling needs work: {edge_passed}/{edge_total}")
+            if conc_total and conc_passed < conc_t80:
+                weaknesses.append(f"Concurrent operation reliability issues: {conc_passed}/{conc_total}")
+            if failed > failed_t10:
+                weaknesses.append(f"High failure rate: {failed}/{total_tests} tests failed")
+
+            if not weaknesses:
+                weaknesses.append("No significant weaknesses detected - system is production-ready")
+
+            # Generate recommendations
+            recommendations = []
+            if structural_total and structural_perf_met < structural_t80:
+                recommendations.append("Optimize slow queries - add indexes or cache frequently accessed paths")
+            if param_total and param_passed < param_t90:
+                recommendations.append("Strengthen input validation - add more parameter checks")
+            if edge_total and edge_passed < edge_t85:
+                recommendations.append("Improve edge case handling - add more defensive checks")
+            if conc_total and conc_passed < conc_t90:
+                recommendations.append("Review concurrent operation handling - check for race conditions")
+            if failed > 0:
+                recommendations.append(f"Investigate {failed} failed tests - review logs for root causes")
+
+            if not recommendations:
+                recommendations.append("System is performing well - continue monitoring and maintain test coverage")
 
         self.results["summary"] = {
             "total_tests": total_tests,
@@ -235,27 +462,27 @@ class StressTestRunner:
             "partial": partial,
             "failed": failed,
             "pass_rate": pass_rate,
-            "execution_time_seconds": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
+            "execution_time_seconds": time.perf_counter() - self.start_time if self.start_time else 0,
             "test_categories": {
                 "structural_queries": {
-                    "total": len(structural_tests),
+                    "total": structural_total,
                     "passed": structural_passed,
                     "performance_targets_met": structural_perf_met,
                 },
                 "parameter_validation": {
-                    "total": len(param_tests),
+                    "total": param_total,
                     "passed": param_passed,
                 },
                 "edge_cases": {
-                    "total": len(edge_tests),
+                    "total": edge_total,
                     "passed": edge_passed,
                 },
                 "performance": {
-                    "total": len(perf_tests),
+                    "total": perf_total,
                     "targets_met": perf_targets_met,
                 },
                 "concurrent_operations": {
-                    "total": len(conc_tests),
+                    "total": conc_total,
                     "passed": conc_passed,
                 },
             },
@@ -264,27 +491,48 @@ class StressTestRunner:
             "recommendations": recommendations,
         }
 
-    def save_results(self) -> Path:
+    async def save_results(self) -> Path:
         """Save test results to file.
 
+        Serialization and file I/O run in a worker thread so the event loop
+        is not blocked while large results are dumped.
+
         Returns:
             Path to the saved results file
         """
-        output_dir = Path(__file__).parent.parent.parent / "infrastructure" / "benchmarks"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        return await asyncio.to_thread(self._write_results)
 
-        timestamp = datetime.now().strftime("%Y-%m-%d")
+    def _write_results(self) -> Path:
+        """Write the results file synchronously.
 
-        if HAS_YAML:
-            output_file = output_dir / f"stress-test-{timestamp}.yaml"
-            with open(output_file, "w") as f:
-                yaml.dump(self.results, f, default_flow_style=False, sort_keys=False)
-        else:
-            output_file = output_dir / f"stress-test-{timestamp}.json"
-            with open(output_file, "w") as f:
-                json.dump(self.results, f, indent=2)
+        Streams indented JSON category by category (gzip-compressed once it
+        passes ``COMPRESS_THRESHOLD_BYTES``), plus a ``.msgpack`` copy of the same
+        results when msgpack is installed.
+
+        Returns:
+            Path to the saved results file
+        """
+        timestamp = self.run_date or datetime.now().strftime("%Y-%m-%d")
+
+        output_file = OUTPUT_DIR / f"stress-test-{timestamp}.json"
+        with open(output_file, "wb") as f:
+            _stream_results_json(f, self.results)
+            size = f.tell()
+
+        if size > COMPRESS_THRESHOLD_BYTES:
+            compressed_file = output_file.with_name(output_file.name + ".gz")
+            with open(output_file, "rb") as src, gzip.open(compressed_file, "wb", compresslevel=1) as dst:
+                shutil.copyfileobj(src, dst)
+            output_file.unlink()
+            output_file = compressed_file
 
         logger.info(f"Results saved to {output_file}")
+
+        if HAS_MSGPACK:
+            msgpack_file = OUTPUT_DIR / f"stress-test-{timestamp}.msgpack"
+            with open(msgpack_file, "wb") as f:
+                f.write(msgpack.packb(_serializable(self.results), use_bin_type=True))
+            logger.info(f"Binary results saved to {msgpack_file}")
         return output_file
 
     def print_summary(self, output_file: Path):
@@ -294,52 +542,14 @@ class StressTestRunner:
             output_file: Path to the saved results file
         """
         summary = self.results['summary']
-
-        print(f"\n{'='*80}")
-        print(f"{'STRUCTURAL QUERY STRESS TEST RESULTS':^80}")
-        print(f"{'='*80}\n")
-
-        print(f"✅ Stress test completed successfully!")
-        print(f"📊 Results saved to: {output_file}\n")
-
-        print(f"{'OVERALL STATISTICS':^80}")
-        print(f"{'-'*80}")
-        print(f"  Total tests run:    {summary['total_tests']}")
-        print(f"  ✅ Passed:          {summary['passed']}")
-        print(f"  ⚠️  Partial:         {summary['partial']}")
-        print(f"  ❌ Failed:          {summary['failed']}")
-        print(f"  📈 Pass rate:       {summary['pass_rate']}")
-        print(f"  ⏱️  Execution time:  {summary['execution_time_seconds']:.2f}s\n")
-
-        print(f"{'TEST CATEGORIES':^80}")
-        print(f"{'-'*80}")
-        for category, stats in summary['test_categories'].items():
-            category_name = category.replace('_', ' ').title()
-            if isinstance(stats, dict):
-                if "passed" in stats:
-                    print(f"  {category_name:.<45} {stats['passed']}/{stats['total']} passed")
-                elif "targets_met" in stats:
-                    print(f"  {category_name:.<45} {stats['targets_met']}/{stats['total']} targets met")
-        print()
-
-        print(f"{'STRENGTHS':^80}")
-        print(f"{'-'*80}")
-        for i, strength in enumerate(summary['strengths'], 1):
-            print(f"  {i}. {strength}")
-        print()
-
-        print(f"{'WEAKNESSES':^80}")
-        print(f"{'-'*80}")
-        for i, weakness in enumerate(summary['weaknesses'], 1):
-            print(f"  {i}. {weakness}")
-        print()
-
-        print(f"{'RECOMMENDATIONS':^80}")
-        print(f"{'-'*80}")
-        for i, rec in enumerate(summary['recommendations'], 1):
-            print(f"  {i}. {rec}")
-        print()
-
-        print(f"{'='*80}")
-        print(f"For detailed results, see: {output_file}")
-        print(f"{'='*80}\n")
+        sys.stdout.write(SUMMARY_TEMPLATE.format_map({
+            **summary,
+            "output_file": output_file,
+            "categories": "".join(
+                _format_category_line(category, stats)
+                for category, stats in summary['test_categories'].items()
+            ),
+            "strengths": _format_numbered(summary['strengths']),
+            "weaknesses": _format_numbered(summary['weaknesses']),
+            "recommendations": _format_numbered(summary['recommendations']),
+        }))
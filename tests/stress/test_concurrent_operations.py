@@ -9,15 +9,121 @@ Tests concurrent execution of structural query tools:
 """
 
 import asyncio
+import os
+import statistics
 import time
 from typing import Any
 
 from tests.stress.base import BaseStressTest
 
 
+async def _settle(coro: Any) -> tuple[bool, str, int]:
+    """Await ``coro`` and report ``(succeeded, short error message, elapsed_ns)``.
+
+    Only the message is kept, so failed calls don't hold on to exception
+    objects and their tracebacks.
+    """
+    start = time.perf_counter_ns()
+    try:
+        await coro
+        return True, "", time.perf_counter_ns() - start
+    except Exception as e:
+        return False, str(e)[:100], time.perf_counter_ns() - start
+
+
+async def _run_all(coros: Any) -> list[tuple[bool, str, int]]:
+    """Run ``coros`` concurrently in a TaskGroup and collect ``_settle`` outcomes."""
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_settle(coro)) for coro in coros]
+    return [task.result() for task in tasks]
+
+
+def _count_ok(outcomes: list[tuple[bool, str, int]]) -> int:
+    """Count successful ``_run_all`` outcomes."""
+    return sum(ok for ok, _, _ in outcomes)
+
+
+def _latency_fields(outcomes: list[tuple[bool, str, int]]) -> dict[str, int]:
+    """Per-task latency percentiles of ``_run_all`` outcomes, in ms."""
+    durations = [elapsed for _, _, elapsed in outcomes]
+    if len(durations) < 2:
+        p50 = p95 = p99 = durations[0] if durations else 0
+    else:
+        cuts = statistics.quantiles(durations, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        "p50_ms": int(p50 // 1_000_000),
+        "p95_ms": int(p95 // 1_000_000),
+        "p99_ms": int(p99 // 1_000_000),
+    }
+
+
+async def _limited(
+    sem: asyncio.Semaphore, coro: Any, timings: list[tuple[int, int]]
+) -> Any:
+    """Await ``coro`` once ``sem`` admits it, recording (queue_ms, exec_ms)."""
+    queued = time.perf_counter_ns()
+    async with sem:
+        acquired = time.perf_counter_ns()
+        try:
+            return await coro
+        finally:
+            timings.append((
+                (acquired - queued) // 1_000_000,
+                (time.perf_counter_ns() - acquired) // 1_000_000,
+            ))
+
+
+def _timing_fields(timings: list[tuple[int, int]]) -> dict[str, int]:
+    """Summarize ``_limited`` timings as max queue wait and average execution."""
+    if not timings:
+        return {"max_queue_wait_ms": 0, "avg_exec_ms": 0}
+    return {
+        "max_queue_wait_ms": max(wait for wait, _ in timings),
+        "avg_exec_ms": sum(run for _, run in timings) // len(timings),
+    }
+
+
 class ConcurrentOperationsTest(BaseStressTest):
     """Comprehensive concurrent operations tests."""
 
+    # Upper bound on in-flight queries in CONC3/CONC5 unless MEMGRAPH_POOL overrides it;
+    # sized above CONC5's 20 tasks so stress runs measure the server, not the limiter
+    POOL_SIZE_DEFAULT = 32
+
+    HANDLER_NAMES = (
+        "query_callers",
+        "query_hierarchy",
+        "query_dependencies",
+        "query_module_exports",
+    )
+
+    async def _warmup(self) -> None:
+        """Run each handler once, untimed, so Memgraph has planned every query shape."""
+        calls = {
+            "query_callers": {
+                "function_name": self._qn_main,
+                "max_depth": 1,
+            },
+            "query_hierarchy": {
+                "class_name": self._qn_apierror,
+                "direction": "both",
+            },
+            "query_dependencies": {
+                "target": self._qn_benchmark_models,
+                "dependency_type": "all",
+            },
+            "query_module_exports": {
+                "module_name": self._qn_api_client,
+                "include_private": False,
+            },
+        }
+        await _run_all(
+            self._handlers[name](**kwargs)
+            for name, kwargs in calls.items()
+            if name in self._handlers
+        )
+
     async def get_test_results(self) -> dict[str, Any]:
         """Run all concurrent operations tests.
 
@@ -25,38 +131,35 @@ class ConcurrentOperationsTest(BaseStressTest):
             Dictionary mapping test IDs to test results
         """
         results = {}
+        pool_size = int(os.getenv("MEMGRAPH_POOL", self.POOL_SIZE_DEFAULT))
+        await self._warmup()
 
         # CONC1: Multiple simultaneous query_callers
         self.log_test("CONC1", "Concurrent query_callers (3 simultaneous)")
         try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            start = time.time()
+            handler = self._handlers["query_callers"]
+            start = time.perf_counter_ns()
 
             tasks = [
+                handler(function_name=self._qn_main, max_depth=1),
+                handler(function_name=self._qn_parse_args, max_depth=1),
                 handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
+                    function_name=f"{self._qn_api_client}.APIClient.generate",
                     max_depth=1
                 ),
-                handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.parse_args",
-                    max_depth=1
-                ),
-                handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIClient.generate",
-                    max_depth=1
-                )
             ]
 
-            concurrent_results = await asyncio.gather(*tasks, return_exceptions=True)
-            elapsed = int((time.time() - start) * 1000)
+            concurrent_results = await _run_all(tasks)
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
 
-            successful = sum(1 for r in concurrent_results if not isinstance(r, Exception))
+            successful = _count_ok(concurrent_results)
 
             results["CONC1"] = self.create_result(
                 status="pass" if successful == len(tasks) else "partial",
                 successful_queries=successful,
                 total_queries=len(tasks),
                 response_time_ms=elapsed,
+                **_latency_fields(concurrent_results),
                 notes=f"{successful}/{len(tasks)} concurrent queries succeeded in {elapsed}ms"
             )
         except Exception as e:
@@ -70,37 +173,38 @@ class ConcurrentOperationsTest(BaseStressTest):
         # CONC2: Mixed tool types concurrently
         self.log_test("CONC2", "Mixed tool types concurrent execution")
         try:
-            start = time.time()
+            start = time.perf_counter_ns()
 
-            caller_handler, _ = self.tools.get_tool_handler("query_callers")
-            hierarchy_handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            deps_handler, _ = self.tools.get_tool_handler("query_dependencies")
+            caller_handler = self._handlers["query_callers"]
+            hierarchy_handler = self._handlers["query_hierarchy"]
+            deps_handler = self._handlers["query_dependencies"]
 
             tasks = [
                 caller_handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
+                    function_name=self._qn_main,
                     max_depth=1
                 ),
                 hierarchy_handler(
-                    class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
+                    class_name=self._qn_apierror,
                     direction="both"
                 ),
                 deps_handler(
-                    target=f"{self.project_name}.scripts.benchmark.benchmark_models",
+                    target=self._qn_benchmark_models,
                     dependency_type="all"
                 )
             ]
 
-            mixed_results = await asyncio.gather(*tasks, return_exceptions=True)
-            elapsed = int((time.time() - start) * 1000)
+            mixed_results = await _run_all(tasks)
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
 
-            successful = sum(1 for r in mixed_results if not isinstance(r, Exception))
+            successful = _count_ok(mixed_results)
 
             results["CONC2"] = self.create_result(
                 status="pass" if successful == len(tasks) else "partial",
                 successful_queries=successful,
                 total_queries=len(tasks),
                 response_time_ms=elapsed,
+                **_latency_fields(mixed_results),
                 notes=f"Mixed concurrent execution: {successful}/{len(tasks)} in {elapsed}ms"
             )
         except Exception as e:
@@ -114,22 +218,25 @@ class ConcurrentOperationsTest(BaseStressTest):
         # CONC3: High load - 10 simultaneous queries
         self.log_test("CONC3", "High load test (10 concurrent queries)")
         try:
-            start = time.time()
+            start = time.perf_counter_ns()
 
-            handler, _ = self.tools.get_tool_handler("query_module_exports")
+            # Every call is issued, even though they are identical, to load the server
+            handler = self._handlers["query_module_exports"]
+            sem = asyncio.Semaphore(pool_size)
+            timings: list[tuple[int, int]] = []
 
             tasks = [
-                handler(
-                    module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
+                _limited(sem, handler(
+                    module_name=self._qn_api_client,
                     include_private=False
-                )
+                ), timings)
                 for _ in range(10)
             ]
 
-            high_load_results = await asyncio.gather(*tasks, return_exceptions=True)
-            elapsed = int((time.time() - start) * 1000)
+            high_load_results = await _run_all(tasks)
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
 
-            successful = sum(1 for r in high_load_results if not isinstance(r, Exception))
+            successful = _count_ok(high_load_results)
 
             results["CONC3"] = self.create_result(
                 status="pass" if successful >= 8 else "partial",  # Allow some failures
@@ -137,6 +244,8 @@ class ConcurrentOperationsTest(BaseStressTest):
                 total_queries=len(tasks),
                 response_time_ms=elapsed,
                 avg_time_per_query=elapsed // len(tasks),
+                **_timing_fields(timings),
+                **_latency_fields(high_load_results),
                 notes=f"High load: {successful}/{len(tasks)} succeeded in {elapsed}ms"
             )
         except Exception as e:
@@ -150,29 +259,30 @@ class ConcurrentOperationsTest(BaseStressTest):
         # CONC4: Variable depth concurrent queries
         self.log_test("CONC4", "Variable depth concurrent queries")
         try:
-            start = time.time()
+            start = time.perf_counter_ns()
 
-            handler, _ = self.tools.get_tool_handler("query_callers")
+            handler = self._handlers["query_callers"]
 
             # Different depths to test query complexity variance
             tasks = [
                 handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
+                    function_name=self._qn_main,
                     max_depth=d
                 )
                 for d in [1, 2, 3, 1, 2]
             ]
 
-            depth_results = await asyncio.gather(*tasks, return_exceptions=True)
-            elapsed = int((time.time() - start) * 1000)
+            depth_results = await _run_all(tasks)
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
 
-            successful = sum(1 for r in depth_results if not isinstance(r, Exception))
+            successful = _count_ok(depth_results)
 
             results["CONC4"] = self.create_result(
                 status="pass" if successful == len(tasks) else "partial",
                 successful_queries=successful,
                 total_queries=len(tasks),
                 response_time_ms=elapsed,
+                **_latency_fields(depth_results),
                 notes=f"Variable depth queries: {successful}/{len(tasks)} in {elapsed}ms"
             )
         except Exception as e:
@@ -186,44 +296,48 @@ class ConcurrentOperationsTest(BaseStressTest):
         # CONC5: Extreme load - 20 simultaneous complex queries
         self.log_test("CONC5", "Extreme load test (20 concurrent complex queries)")
         try:
-            start = time.time()
+            start = time.perf_counter_ns()
 
-            # Mix of different tools for realistic load
-            caller_handler, _ = self.tools.get_tool_handler("query_callers")
-            hierarchy_handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            deps_handler, _ = self.tools.get_tool_handler("query_dependencies")
-            exports_handler, _ = self.tools.get_tool_handler("query_module_exports")
+            # Mix of different tools for realistic load; repeats are issued separately
+            caller_handler = self._handlers["query_callers"]
+            hierarchy_handler = self._handlers["query_hierarchy"]
+            deps_handler = self._handlers["query_dependencies"]
+            exports_handler = self._handlers["query_module_exports"]
 
             tasks = []
             # 5 caller queries
             for _ in range(5):
                 tasks.append(caller_handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
+                    function_name=self._qn_main,
                     max_depth=2
                 ))
             # 5 hierarchy queries
             for _ in range(5):
                 tasks.append(hierarchy_handler(
-                    class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
+                    class_name=self._qn_apierror,
                     direction="both"
                 ))
             # 5 dependency queries
             for _ in range(5):
                 tasks.append(deps_handler(
-                    target=f"{self.project_name}.scripts.benchmark.benchmark_models",
+                    target=self._qn_benchmark_models,
                     dependency_type="all"
                 ))
             # 5 export queries
             for _ in range(5):
                 tasks.append(exports_handler(
-                    module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
+                    module_name=self._qn_api_client,
                     include_private=False
                 ))
 
-            extreme_results = await asyncio.gather(*tasks, return_exceptions=True)
-            elapsed = int((time.time() - start) * 1000)
+            sem = asyncio.Semaphore(pool_size)
+            timings = []
+            extreme_results = await _run_all(
+                _limited(sem, task, timings) for task in tasks
+            )
+            elapsed = (time.perf_counter_ns() - start) // 1_000_000
 
-            successful = sum(1 for r in extreme_results if not isinstance(r, Exception))
+            successful = _count_ok(extreme_results)
 
             results["CONC5"] = self.create_result(
                 status="pass" if successful >= 16 else "partial",  # Allow some failures under extreme load
@@ -231,6 +345,8 @@ class ConcurrentOperationsTest(BaseStressTest):
                 total_queries=len(tasks),
                 response_time_ms=elapsed,
                 avg_time_per_query=elapsed // len(tasks),
+                **_timing_fields(timings),
+                **_latency_fields(extreme_results),
                 notes=f"Extreme load: {successful}/{len(tasks)} succeeded in {elapsed}ms"
             )
         except Exception as e:
@@ -8,370 +8,235 @@ Tests parameter validation for all structural query tools:
 - Malformed inputs
 """
 
-import time
+import re
+from collections.abc import Callable
 from typing import Any
 
-from tests.stress.base import BaseStressTest
+from tests.stress.base import (
+    ERROR_FAILS,
+    ERROR_REJECTS,
+    BaseStressTest,
+    QueryResult,
+    StressCase,
+    error_text,
+    is_error,
+)
+
+# Write clauses query_cypher must reject; used to sanity-check the P11-P14 queries
+_FORBIDDEN_RE = re.compile(r"\b(DELETE|SET|CREATE|MERGE|DROP|REMOVE)\b", re.IGNORECASE)
+
+# error_code values query_cypher uses for rejected writes; other FORBIDDEN_* codes still count
+_FORBIDDEN_CODES = frozenset({"FORBIDDEN", "FORBIDDEN_WRITE", "FORBIDDEN_OPERATION"})
+
+
+def _expect_error(result: QueryResult) -> dict[str, Any]:
+    """Pass when the tool answered with an error payload."""
+    has_error = is_error(result)
+    return {
+        "status": "pass" if has_error else "fail",
+        "handled_gracefully": has_error,
+        "error_message": error_text(result, None),
+    }
+
+
+def _check_dependency_type(result: QueryResult) -> dict[str, Any]:
+    # May pass Python type checking, so a missing error is only partial
+    has_error = is_error(result)
+    return {"status": "pass" if has_error else "partial", "handled_gracefully": has_error}
+
+
+def _check_forbidden(result: QueryResult) -> dict[str, Any]:
+    has_error = is_error(result)
+    code = result.get("error_code") or ""
+    is_forbidden = code in _FORBIDDEN_CODES or code.startswith("FORBIDDEN")
+    return {
+        "status": "pass" if (has_error and is_forbidden) else "fail",
+        "handled_gracefully": has_error,
+        "error_message": error_text(result, None),
+    }
+
+
+def _check_malformed(result: QueryResult) -> dict[str, Any]:
+    has_error = "error" in result or isinstance(result, dict)
+    return {"status": "pass" if has_error else "fail", "error_handled": has_error}
+
+
+# Valid arguments per tool; a boundary case overrides exactly one of them
+_BASELINE_KWARGS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "query_callers": lambda t: {"function_name": t._qn_main, "max_depth": 1},
+    "query_hierarchy": lambda t: {"class_name": t._qn_apierror, "direction": "both"},
+    "query_call_graph": lambda t: {
+        "entry_point": t._qn_main, "max_depth": 2, "max_nodes": 30,
+    },
+}
+
+# Out-of-range integers: (id, tool, param, value, label, notes, on_error, error_notes)
+BOUNDS: tuple[tuple[str, str, str, int, str, str, dict[str, Any], str], ...] = (
+    (
+        "P1", "query_callers", "max_depth", 999, "999",
+        "Max depth validation (should reject values > 5)",
+        ERROR_FAILS, "Max depth validation failed unexpectedly",
+    ),
+    (
+        "P2", "query_callers", "max_depth", -1, "negative",
+        "Negative max_depth validation",
+        ERROR_FAILS, "Negative max_depth validation failed",
+    ),
+    (
+        "P6", "query_hierarchy", "max_depth", 100, "100",
+        "Max depth validation for hierarchy (should reject > 10)",
+        ERROR_FAILS, "Max depth validation failed unexpectedly",
+    ),
+    (
+        "P8", "query_call_graph", "max_nodes", -10, "negative",
+        "Negative max_nodes validation",
+        ERROR_FAILS, "Negative max_nodes validation failed",
+    ),
+    (
+        "P9", "query_call_graph", "max_depth", 0, "zero",
+        "Zero max_depth validation",
+        ERROR_REJECTS, "Zero max_depth correctly rejected",
+    ),
+)
+
+
+def _bound_case(
+    test_id: str,
+    tool: str,
+    param: str,
+    value: int,
+    label: str,
+    notes: str,
+    on_error: dict[str, Any],
+    error_notes: str,
+) -> StressCase:
+    """Build a case calling ``tool`` with valid arguments except ``param=value``."""
+    baseline = _BASELINE_KWARGS[tool]
+    return StressCase(
+        test_id, f"{tool} - invalid {param} ({label})", tool,
+        lambda t: {**baseline(t), param: value},
+        _expect_error, notes,
+        on_error, error_notes,
+    )
+
+
+def _forbidden_case(
+    test_id: str, description: str, query: str, notes: str, failure_notes: str
+) -> StressCase:
+    """Build a case sending a write query to query_cypher, expecting FORBIDDEN_*.
+
+    The query must contain a write keyword, so a typo in the table can't turn
+    it into a harmless read that "passes".
+    """
+    if not _FORBIDDEN_RE.search(query):
+        raise ValueError(f"{test_id} query contains no write keyword: {query}")
+    return StressCase(
+        test_id, description, "query_cypher",
+        lambda t: {"query": query, "limit": 10},
+        _check_forbidden, notes,
+        ERROR_FAILS, failure_notes,
+    )
+
+
+_OTHER_CASES: tuple[StressCase, ...] = (
+    StressCase(
+        "P3", "query_callers - None function_name", "query_callers",
+        lambda t: {"function_name": None, "max_depth": 1},
+        lambda result: {"status": "partial"},
+        "None parameter may or may not be caught at type level",
+        ERROR_REJECTS, "None parameter correctly rejected",
+    ),
+    StressCase(
+        "P4", "query_callers - empty function_name", "query_callers",
+        lambda t: {"function_name": "", "max_depth": 1},
+        _expect_error,
+        "Empty string parameter validation",
+        ERROR_REJECTS, "Empty string correctly rejected",
+    ),
+    StressCase(
+        "P5", "query_hierarchy - invalid direction parameter", "query_hierarchy",
+        lambda t: {
+            "class_name": t._qn_apierror,
+            "direction": "sideways",  # Invalid direction
+        },
+        _expect_error,
+        "Invalid direction parameter validation",
+        ERROR_REJECTS, "Invalid direction correctly rejected",
+    ),
+    StressCase(
+        "P7", "query_dependencies - invalid dependency_type", "query_dependencies",
+        lambda t: {
+            "target": t._qn_benchmark_models,
+            "dependency_type": "invalid_type",  # Should be "imports", "calls", or "all"
+        },
+        _check_dependency_type,
+        "Invalid dependency_type parameter (may pass Python type checking)",
+        ERROR_REJECTS, "Invalid dependency_type correctly rejected",
+    ),
+    StressCase(
+        "P10", "query_cypher - empty query string", "query_cypher",
+        lambda t: {"query": "", "limit": 10},
+        _expect_error,
+        "Empty Cypher query validation",
+        ERROR_FAILS, "Empty query validation failed",
+    ),
+    _forbidden_case(
+        "P11", "query_cypher - destructive query prevention (DELETE)",
+        "DELETE n",
+        "DELETE operation should be forbidden",
+        "Destructive query prevention failed",
+    ),
+    _forbidden_case(
+        "P12", "query_cypher - SET operation prevention",
+        "MATCH (n:Function) SET n.test = 'value' RETURN n",
+        "SET operation should be forbidden",
+        "SET operation prevention failed",
+    ),
+    _forbidden_case(
+        "P13", "query_cypher - CREATE operation prevention",
+        "CREATE (n:TestNode {name: 'test'}) RETURN n",
+        "CREATE operation should be forbidden",
+        "CREATE operation prevention failed",
+    ),
+    _forbidden_case(
+        "P14", "query_cypher - MERGE operation prevention",
+        "MERGE (n:TestNode {name: 'test'}) RETURN n",
+        "MERGE operation should be forbidden",
+        "MERGE operation prevention failed",
+    ),
+    StressCase(
+        "P15", "query_cypher - malformed Cypher syntax", "query_cypher",
+        lambda t: {"query": "MATCH (n:Invalid syntax here", "limit": 10},
+        _check_malformed,
+        "Malformed Cypher syntax should be caught",
+        {"status": "pass", "error_handled": True},
+        "Malformed Cypher syntax caught by exception",
+    ),
+)
+
+CASES: tuple[StressCase, ...] = tuple(
+    sorted(
+        (*(_bound_case(*bound) for bound in BOUNDS), *_OTHER_CASES),
+        key=lambda case: int(case.id[1:]),
+    )
+)
 
 
 class ParameterValidationTest(BaseStressTest):
     """Comprehensive parameter validation tests."""
 
+    HANDLER_NAMES = (
+        "query_callers",
+        "query_hierarchy",
+        "query_dependencies",
+        "query_call_graph",
+        "query_cypher",
+    )
+
     async def get_test_results(self) -> dict[str, Any]:
         """Run all parameter validation tests.
 
         Returns:
             Dictionary mapping test IDs to test results
         """
-        results = {}
-
-        # P1: query_callers - Invalid max_depth (too high)
-        self.log_test("P1", "query_callers - invalid max_depth (999)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=999  # Way beyond allowed max
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P1"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Max depth validation (should reject values > 5)"
-            )
-        except Exception as e:
-            self.log_error("P1", e)
-            results["P1"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Max depth validation failed unexpectedly"
-            )
-
-        # P2: query_callers - Invalid max_depth (negative)
-        self.log_test("P2", "query_callers - invalid max_depth (negative)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=-1
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P2"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Negative max_depth validation"
-            )
-        except Exception as e:
-            self.log_error("P2", e)
-            results["P2"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Negative max_depth validation failed"
-            )
-
-        # P3: query_callers - None function_name
-        self.log_test("P3", "query_callers - None function_name")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name=None,  # type: ignore
-                max_depth=1
-            )
-            results["P3"] = self.create_result(
-                status="partial",
-                notes="None parameter may or may not be caught at type level"
-            )
-        except (TypeError, AttributeError, Exception) as e:
-            results["P3"] = self.create_result(
-                status="pass",
-                handled_gracefully=True,
-                error_message=str(e)[:100],
-                notes="None parameter correctly rejected"
-            )
-
-        # P4: query_callers - Empty function_name
-        self.log_test("P4", "query_callers - empty function_name")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name="",
-                max_depth=1
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P4"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Empty string parameter validation"
-            )
-        except Exception as e:
-            results["P4"] = self.create_result(
-                status="pass",
-                handled_gracefully=True,
-                error_message=str(e)[:100],
-                notes="Empty string correctly rejected"
-            )
-
-        # P5: query_hierarchy - Invalid direction
-        self.log_test("P5", "query_hierarchy - invalid direction parameter")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            result = await handler(
-                class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                direction="sideways"  # Invalid direction
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P5"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Invalid direction parameter validation"
-            )
-        except Exception as e:
-            results["P5"] = self.create_result(
-                status="pass",
-                handled_gracefully=True,
-                error_message=str(e)[:100],
-                notes="Invalid direction correctly rejected"
-            )
-
-        # P6: query_hierarchy - Invalid max_depth
-        self.log_test("P6", "query_hierarchy - invalid max_depth (100)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            result = await handler(
-                class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                direction="both",
-                max_depth=100  # Beyond allowed max
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P6"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Max depth validation for hierarchy (should reject > 10)"
-            )
-        except Exception as e:
-            results["P6"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Max depth validation failed unexpectedly"
-            )
-
-        # P7: query_dependencies - Invalid dependency_type
-        self.log_test("P7", "query_dependencies - invalid dependency_type")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_dependencies")
-            result = await handler(
-                target=f"{self.project_name}.scripts.benchmark.benchmark_models",
-                dependency_type="invalid_type"  # Should be "imports", "calls", or "all"
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P7"] = self.create_result(
-                status="pass" if has_error else "partial",
-                handled_gracefully=has_error,
-                notes="Invalid dependency_type parameter (may pass Python type checking)"
-            )
-        except Exception as e:
-            results["P7"] = self.create_result(
-                status="pass",
-                handled_gracefully=True,
-                error_message=str(e)[:100],
-                notes="Invalid dependency_type correctly rejected"
-            )
-
-        # P8: query_call_graph - Invalid max_nodes (negative)
-        self.log_test("P8", "query_call_graph - invalid max_nodes (negative)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_call_graph")
-            result = await handler(
-                entry_point=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=2,
-                max_nodes=-10
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P8"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Negative max_nodes validation"
-            )
-        except Exception as e:
-            results["P8"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Negative max_nodes validation failed"
-            )
-
-        # P9: query_call_graph - Invalid max_depth (zero)
-        self.log_test("P9", "query_call_graph - invalid max_depth (zero)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_call_graph")
-            result = await handler(
-                entry_point=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=0,
-                max_nodes=30
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P9"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Zero max_depth validation"
-            )
-        except Exception as e:
-            results["P9"] = self.create_result(
-                status="pass",
-                handled_gracefully=True,
-                error_message=str(e)[:100],
-                notes="Zero max_depth correctly rejected"
-            )
-
-        # P10: query_cypher - Empty query string
-        self.log_test("P10", "query_cypher - empty query string")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="",
-                limit=10
-            )
-            has_error = "error" in result or "error_code" in result
-            results["P10"] = self.create_result(
-                status="pass" if has_error else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="Empty Cypher query validation"
-            )
-        except Exception as e:
-            results["P10"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Empty query validation failed"
-            )
-
-        # P11: query_cypher - Destructive query prevention (DELETE)
-        self.log_test("P11", "query_cypher - destructive query prevention (DELETE)")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="DELETE n",
-                limit=10
-            )
-            has_error = "error" in result or "error_code" in result
-            is_forbidden = "FORBIDDEN" in str(result.get("error_code", ""))
-            results["P11"] = self.create_result(
-                status="pass" if (has_error and is_forbidden) else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="DELETE operation should be forbidden"
-            )
-        except Exception as e:
-            results["P11"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="Destructive query prevention failed"
-            )
-
-        # P12: query_cypher - SET operation prevention
-        self.log_test("P12", "query_cypher - SET operation prevention")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="MATCH (n:Function) SET n.test = 'value' RETURN n",
-                limit=10
-            )
-            has_error = "error" in result or "error_code" in result
-            is_forbidden = "FORBIDDEN" in str(result.get("error_code", ""))
-            results["P12"] = self.create_result(
-                status="pass" if (has_error and is_forbidden) else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="SET operation should be forbidden"
-            )
-        except Exception as e:
-            results["P12"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="SET operation prevention failed"
-            )
-
-        # P13: query_cypher - CREATE operation prevention
-        self.log_test("P13", "query_cypher - CREATE operation prevention")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="CREATE (n:TestNode {name: 'test'}) RETURN n",
-                limit=10
-            )
-            has_error = "error" in result or "error_code" in result
-            is_forbidden = "FORBIDDEN" in str(result.get("error_code", ""))
-            results["P13"] = self.create_result(
-                status="pass" if (has_error and is_forbidden) else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="CREATE operation should be forbidden"
-            )
-        except Exception as e:
-            results["P13"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="CREATE operation prevention failed"
-            )
-
-        # P14: query_cypher - MERGE operation prevention
-        self.log_test("P14", "query_cypher - MERGE operation prevention")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="MERGE (n:TestNode {name: 'test'}) RETURN n",
-                limit=10
-            )
-            has_error = "error" in result or "error_code" in result
-            is_forbidden = "FORBIDDEN" in str(result.get("error_code", ""))
-            results["P14"] = self.create_result(
-                status="pass" if (has_error and is_forbidden) else "fail",
-                handled_gracefully=has_error,
-                error_message=result.get("error", ""),
-                notes="MERGE operation should be forbidden"
-            )
-        except Exception as e:
-            results["P14"] = self.create_result(
-                status="fail",
-                handled_gracefully=False,
-                error_message=str(e)[:100],
-                notes="MERGE operation prevention failed"
-            )
-
-        # P15: query_cypher - Malformed Cypher syntax
-        self.log_test("P15", "query_cypher - malformed Cypher syntax")
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query="MATCH (n:Invalid syntax here",
-                limit=10
-            )
-            has_error = "error" in result or isinstance(result, dict)
-            results["P15"] = self.create_result(
-                status="pass" if has_error else "fail",
-                error_handled=has_error,
-                notes="Malformed Cypher syntax should be caught"
-            )
-        except Exception as e:
-            results["P15"] = self.create_result(
-                status="pass",
-                error_handled=True,
-                error_message=str(e)[:100],
-                notes="Malformed Cypher syntax caught by exception"
-            )
-
-        return results
+        return await self.run_cases(CASES)
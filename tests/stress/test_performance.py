@@ -10,160 +10,194 @@ Tests performance characteristics of structural query tools:
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from tests.stress.base import BaseStressTest
 
+NS_PER_MS = 1_000_000
+# Recorded for an iteration that raised, so it reports as 999999ms
+_FAILED_NS = 999_999 * NS_PER_MS
+
+
+@dataclass(slots=True)
+class _LatencyStats:
+    """Running count, total, min and max of iteration times, in nanoseconds."""
+
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    def add(self, elapsed_ns: int) -> None:
+        if not self.count or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.total_ns += elapsed_ns
+        self.count += 1
+
+    def below(self, target_ms: int) -> bool:
+        """Whether the fastest iteration beat ``target_ms``."""
+        return bool(self.count) and self.min_ns < target_ms * NS_PER_MS
+
+    def ms_fields(self) -> dict[str, int]:
+        """The ``avg_ms``/``max_ms``/``min_ms`` result fields."""
+        if not self.count:
+            return {"avg_ms": 0, "max_ms": 0, "min_ms": 0}
+        return {
+            "avg_ms": self.total_ns // self.count // NS_PER_MS,
+            "max_ms": self.max_ns // NS_PER_MS,
+            "min_ms": self.min_ns // NS_PER_MS,
+        }
+
 
 class PerformanceTest(BaseStressTest):
     """Comprehensive performance tests."""
 
-    async def get_test_results(self) -> dict[str, Any]:
-        """Run all performance tests.
+    HANDLER_NAMES = (
+        "query_module_exports",
+        "query_callers",
+        "query_call_graph",
+        "query_cypher",
+    )
+    # Response time each test must beat, in ms
+    _TARGETS_MS = {
+        "PERF1": 50,
+        "PERF2": 150,
+        "PERF3": 30,
+        "PERF4": 200,
+        "PERF5": 50,
+        "PERF6": 50,
+        "PERF7": 50,
+    }
+
+    def _tool_call(self, tool: str, **kwargs: Any) -> Callable[[], Awaitable[Any]]:
+        """Bind a tool handler and its arguments into a zero-argument call."""
+        return lambda: self._handlers[tool](**kwargs)
+
+    async def _time_tool(
+        self,
+        test_id: str,
+        description: str,
+        call: Callable[[], Awaitable[Any]],
+        iterations: int,
+        notes: str,
+        warmup_iters: int = 1,
+    ) -> dict[str, Any]:
+        """Time repeated calls and judge the fastest against the test's target.
+
+        A call that raises counts as a 999999ms iteration. Untimed warm-up calls
+        run first so the database's plan cache is primed.
+
+        Args:
+            test_id: Test identifier
+            description: Test description for the log
+            call: Zero-argument coroutine function to time
+            iterations: Number of sequential calls
+            notes: Result notes
+            warmup_iters: Number of untimed calls before the timed ones
 
         Returns:
-            Dictionary mapping test IDs to test results
+            Result dict with avg/max/min timings and whether the target was met
         """
-        results = {}
-
-        # PERF1: Simple structural query response time
-        self.log_test("PERF1", "Simple structural query response time")
-        times = []
-        for _ in range(5):
-            start = time.time()
+        self.log_test(test_id, description)
+        for _ in range(warmup_iters):
             try:
-                handler, _ = self.tools.get_tool_handler("query_module_exports")
-                await handler(
-                    module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
-                    include_private=False
-                )
-                times.append(int((time.time() - start) * 1000))
+                await call()
             except Exception:
-                times.append(999999)
-
-        target_met = min(times) < 50 if times else False
-        results["PERF1"] = {
-            "status": "pass" if target_met else "fail",
-            "avg_ms": sum(times) // len(times) if times else 0,
-            "max_ms": max(times) if times else 0,
-            "min_ms": min(times) if times else 0,
-            "target_met": target_met,
-            "notes": "Simple query should complete in <50ms"
-        }
-
-        # PERF2: Complex traversal query response time
-        self.log_test("PERF2", "Complex traversal query response time")
-        times = []
-        for _ in range(3):
-            start = time.time()
+                pass
+        stats = _LatencyStats()
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
             try:
-                handler, _ = self.tools.get_tool_handler("query_callers")
-                await handler(
-                    function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                    max_depth=3
-                )
-                times.append(int((time.time() - start) * 1000))
+                await call()
+                stats.add(time.perf_counter_ns() - start)
             except Exception:
-                times.append(999999)
+                stats.add(_FAILED_NS)
 
-        target_met = min(times) < 150 if times else False
-        results["PERF2"] = {
+        target_met = stats.below(self._TARGETS_MS[test_id])
+        return {
             "status": "pass" if target_met else "fail",
-            "avg_ms": sum(times) // len(times) if times else 0,
-            "max_ms": max(times) if times else 0,
-            "min_ms": min(times) if times else 0,
+            **stats.ms_fields(),
             "target_met": target_met,
-            "notes": "Complex traversal should complete in <150ms"
+            "notes": notes
         }
 
-        # PERF3: Code snippet retrieval performance
-        self.log_test("PERF3", "Code snippet retrieval performance")
-        times = []
-        for _ in range(5):
-            start = time.time()
-            try:
-                await self.tools.get_code_snippet(
-                    f"{self.project_name}.scripts.benchmark.benchmark_models.main"
-                )
-                times.append(int((time.time() - start) * 1000))
-            except Exception:
-                times.append(999999)
+    async def get_test_results(self) -> dict[str, Any]:
+        """Run all performance tests.
 
-        target_met = min(times) < 30 if times else False
-        results["PERF3"] = {
-            "status": "pass" if target_met else "fail",
-            "avg_ms": sum(times) // len(times) if times else 0,
-            "max_ms": max(times) if times else 0,
-            "min_ms": min(times) if times else 0,
-            "target_met": target_met,
-            "notes": "Code snippet retrieval should complete in <30ms"
-        }
+        Returns:
+            Dictionary mapping test IDs to test results
+        """
+        results = {}
 
-        # PERF4: Call graph generation performance
-        self.log_test("PERF4", "Call graph generation performance")
-        times = []
-        for _ in range(3):
-            start = time.time()
-            try:
-                handler, _ = self.tools.get_tool_handler("query_call_graph")
-                await handler(
-                    entry_point=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                    max_depth=3,
-                    max_nodes=50
-                )
-                times.append(int((time.time() - start) * 1000))
-            except Exception:
-                times.append(999999)
+        # PERF1: Simple structural query response time
+        results["PERF1"] = await self._time_tool(
+            "PERF1", "Simple structural query response time",
+            self._tool_call(
+                "query_module_exports",
+                module_name=self._qn_api_client,
+                include_private=False,
+            ),
+            5, "Simple query should complete in <50ms",
+        )
 
-        target_met = min(times) < 200 if times else False
-        results["PERF4"] = {
-            "status": "pass" if target_met else "fail",
-            "avg_ms": sum(times) // len(times) if times else 0,
-            "max_ms": max(times) if times else 0,
-            "min_ms": min(times) if times else 0,
-            "target_met": target_met,
-            "notes": "Call graph generation should complete in <200ms"
-        }
+        # PERF2: Complex traversal query response time
+        results["PERF2"] = await self._time_tool(
+            "PERF2", "Complex traversal query response time",
+            self._tool_call(
+                "query_callers", function_name=self._qn_main, max_depth=3
+            ),
+            3, "Complex traversal should complete in <150ms",
+        )
 
-        # PERF5: Cypher query performance
-        self.log_test("PERF5", "Custom Cypher query performance")
-        times = []
-        for _ in range(5):
-            start = time.time()
-            try:
-                handler, _ = self.tools.get_tool_handler("query_cypher")
-                await handler(
-                    query=f"MATCH (p:Project {{name: '{self.project_name}'}})-[:CONTAINS]->(f:Function) RETURN f.qualified_name LIMIT 20",
-                    limit=20
-                )
-                times.append(int((time.time() - start) * 1000))
-            except Exception:
-                times.append(999999)
+        # PERF3: Code snippet retrieval performance
+        results["PERF3"] = await self._time_tool(
+            "PERF3", "Code snippet retrieval performance",
+            lambda: self.tools.get_code_snippet(self._qn_main),
+            5, "Code snippet retrieval should complete in <30ms",
+        )
 
-        target_met = min(times) < 50 if times else False
-        results["PERF5"] = {
-            "status": "pass" if target_met else "fail",
-            "avg_ms": sum(times) // len(times) if times else 0,
-            "max_ms": max(times) if times else 0,
-            "min_ms": min(times) if times else 0,
-            "target_met": target_met,
-            "notes": "Custom Cypher query should complete in <50ms"
-        }
+        # PERF4: Call graph generation performance
+        results["PERF4"] = await self._time_tool(
+            "PERF4", "Call graph generation performance",
+            self._tool_call(
+                "query_call_graph",
+                entry_point=self._qn_main,
+                max_depth=3,
+                max_nodes=50,
+            ),
+            3, "Call graph generation should complete in <200ms",
+        )
+
+        # PERF5: Cypher query performance
+        results["PERF5"] = await self._time_tool(
+            "PERF5", "Custom Cypher query performance",
+            self._tool_call(
+                "query_cypher",
+                query="MATCH (p:Project {name: $project})-[:CONTAINS]->(f:Function) RETURN f.qualified_name LIMIT 20",
+                parameters={"project": self.project_name},
+                limit=20,
+            ),
+            5, "Custom Cypher query should complete in <50ms",
+        )
 
         # PERF6: Sequential query performance (5 queries in sequence)
         self.log_test("PERF6", "Sequential query performance")
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
-            handler, _ = self.tools.get_tool_handler("query_module_exports")
+            handler = self._handlers["query_module_exports"]
             for _ in range(5):
                 await handler(
-                    module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
+                    module_name=self._qn_api_client,
                     include_private=False
                 )
-            elapsed = int((time.time() - start) * 1000)
+            elapsed = (time.perf_counter_ns() - start) // NS_PER_MS
             avg = elapsed // 5
 
-            target_met = avg < 50
+            target_met = avg < self._TARGETS_MS["PERF6"]
             results["PERF6"] = {
                 "status": "pass" if target_met else "fail",
                 "avg_ms": avg,
@@ -181,4 +215,44 @@ class PerformanceTest(BaseStressTest):
                 "notes": f"Sequential query test failed: {str(e)[:100]}"
             }
 
+        # PERF7: Gathered batch (10 queries issued together). The handlers call the
+        # database synchronously on one shared connection, so gather still runs them
+        # one after another; this times a serial batch, not overlapping queries
+        self.log_test("PERF7", "Gathered query batch (served serially)")
+        handler = self._handlers.get("query_module_exports")
+
+        async def timed_call() -> int:
+            call_start = time.perf_counter_ns()
+            await handler(module_name=self._qn_api_client, include_private=False)
+            return (time.perf_counter_ns() - call_start) // NS_PER_MS
+
+        start = time.perf_counter_ns()
+        try:
+            call_times = await asyncio.gather(*(timed_call() for _ in range(10)))
+            elapsed = (time.perf_counter_ns() - start) // NS_PER_MS
+            avg = elapsed // 10
+            max_call_ms = max(call_times)
+
+            target_met = avg < self._TARGETS_MS["PERF7"]
+            results["PERF7"] = {
+                "status": "pass" if target_met else "fail",
+                "avg_ms": avg,
+                "total_ms": elapsed,
+                "max_call_ms": max_call_ms,
+                "target_met": target_met,
+                "notes": (
+                    f"10 gathered queries completed serially in {elapsed}ms "
+                    f"(avg {avg}ms, slowest {max_call_ms}ms)"
+                )
+            }
+        except Exception as e:
+            self.log_error("PERF7", e)
+            results["PERF7"] = {
+                "status": "fail",
+                "avg_ms": 0,
+                "total_ms": 0,
+                "target_met": False,
+                "notes": f"Gathered batch test failed: {str(e)[:100]}"
+            }
+
         return results
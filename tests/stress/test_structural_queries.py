@@ -10,553 +10,345 @@ Tests all 7 structural query tools:
 - query_cypher: Expert mode custom queries
 """
 
+import json
+import os
 import time
+from collections.abc import Callable
 from typing import Any
 
-from tests.stress.base import BaseStressTest
+from tests.stress.base import BaseStressTest, StressResult
+
+NS_PER_MS = 1_000_000
+# With STRESS_PROFILE=1 each query_cypher test also records its PROFILE plan, and
+# STRESS_PROFILE_BASELINE may name a JSON file of {test_id: db_hits} to compare to
+_DB_HITS_REGRESSION = 1.2
+
+
+def _fail_on_error(result: dict[str, Any], row_count: int) -> str:
+    """Without an error_code, 0 results is legitimate (the node just has no matches)."""
+    return "fail" if "error_code" in result else "pass"
+
+
+def _partial_if_empty(result: dict[str, Any], row_count: int) -> str:
+    return "pass" if row_count > 0 else "partial"
+
+
+def _partial_without_results(result: dict[str, Any], row_count: int) -> str:
+    return "pass" if result.get("results") else "partial"
+
+
+def _always_pass(result: dict[str, Any], row_count: int) -> str:
+    """For queries where 0 results is normal, e.g. a base class's ancestors."""
+    return "pass"
 
 
 class StructuralQueriesTest(BaseStressTest):
     """Comprehensive structural query tools tests."""
 
-    async def get_test_results(self) -> dict[str, Any]:
-        """Run all structural query tests.
+    HANDLER_NAMES = (
+        "query_callers",
+        "query_hierarchy",
+        "query_dependencies",
+        "query_implementations",
+        "query_module_exports",
+        "query_call_graph",
+        "query_cypher",
+    )
+    # Response time each test must beat, in ms
+    _TARGETS_MS = {
+        "S1": 50,
+        "S2": 150,
+        "S3": 50,
+        "S4": 50,
+        "S5": 100,
+        "S6": 50,
+        "S7": 50,
+        "S8": 100,
+        "S9": 50,
+        "S10": 100,
+        "S11": 50,
+        "S12": 50,
+        "S13": 100,
+        "S14": 300,
+        "S15": 50,
+        "S16": 100,
+    }
+    # Notes per test, formatted with ``row_count`` and ``elapsed`` (ms)
+    _NOTES_FMT = {
+        "S1": "Found {row_count} callers in {elapsed}ms",
+        "S2": "Multi-level traversal found {row_count} callers in {elapsed}ms",
+        "S3": "Found {row_count} descendants in {elapsed}ms",
+        "S4": "Found {row_count} ancestors in {elapsed}ms",
+        "S5": "Bidirectional traversal found {row_count} classes in {elapsed}ms",
+        "S6": "Found {row_count} import dependencies in {elapsed}ms",
+        "S7": "Found {row_count} call dependencies in {elapsed}ms",
+        "S8": "Found {row_count} total dependencies in {elapsed}ms",
+        "S9": "Found {row_count} direct implementations in {elapsed}ms",
+        "S10": (
+            "Found {row_count} total implementations (including indirect) in {elapsed}ms"
+        ),
+        "S11": "Found {row_count} public exports in {elapsed}ms",
+        "S12": "Found {row_count} total exports (including private) in {elapsed}ms",
+        "S13": "Generated call graph with {row_count} nodes in {elapsed}ms",
+        "S14": "Generated deep call graph with {row_count} nodes in {elapsed}ms",
+        "S15": "Custom Cypher query returned {row_count} results in {elapsed}ms",
+        "S16": "Complex Cypher query returned {row_count} results in {elapsed}ms",
+    }
+
+    async def _time_tool(
+        self,
+        test_id: str,
+        description: str,
+        tool: str,
+        kwargs: dict[str, Any],
+        status: Callable[[dict[str, Any], int], str],
+    ) -> StressResult:
+        """Time one tool call and judge it against the test's response-time target.
+
+        Args:
+            test_id: Test identifier
+            description: Test description for the log
+            tool: Name of the tool handler to call
+            kwargs: Handler arguments
+            status: Maps the tool result and its row count to a test status
 
         Returns:
-            Dictionary mapping test IDs to test results
+            Test result with the raw ``elapsed_ns`` and result count;
+            ``_render_results`` adds the ms response time and notes
         """
-        results = {}
-
-        # S1: query_callers - Find function callers (depth 1)
-        self.log_test("S1", "query_callers - find function callers (depth=1)")
-        start = time.time()
+        self.log_test(test_id, description)
+        start = time.perf_counter_ns()
         try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=1,
-                include_paths=True
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            # If no error_code, then 0 results is legitimate (function exists but has no callers)
-            has_error = "error_code" in result
-            metadata = result.get("metadata", {})
-
-            results["S1"] = self.create_result(
-                status="fail" if has_error else "pass",
-                response_time_ms=elapsed,
-                result_count=metadata.get("row_count", 0),
-                performance_target_met=elapsed < 50,
-                notes=f"Found {metadata.get('row_count', 0)} callers in {elapsed}ms"
-            )
+            try:
+                result = await self._handlers[tool](**kwargs)
+            finally:
+                elapsed_ns = time.perf_counter_ns() - start
+
+            try:
+                row_count = result["metadata"]["row_count"]
+            except (KeyError, TypeError):
+                row_count = 0
+            fields = {
+                "elapsed_ns": elapsed_ns,
+                "result_count": row_count,
+                "performance_target_met": (
+                    elapsed_ns < self._TARGETS_MS[test_id] * NS_PER_MS
+                ),
+            }
+            if tool == "query_cypher" and os.getenv("STRESS_PROFILE") == "1":
+                fields["profile"] = {**self._profile_query(kwargs), "rows": row_count}
+            return StressResult(status(result, row_count), 0, fields)
         except Exception as e:
-            self.log_error("S1", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S1"] = self.create_result(
+            self.log_error(test_id, e)
+            return self.create_result(
                 status="fail",
-                response_time_ms=elapsed,
+                elapsed_ns=elapsed_ns,
                 result_count=0,
                 performance_target_met=False,
                 notes=str(e)[:100]
             )
 
-        # S2: query_callers - Multi-level caller traversal (depth 3)
-        self.log_test("S2", "query_callers - multi-level traversal (depth=3)")
-        start = time.time()
+    def _profile_query(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Run a query_cypher call's query under PROFILE, outside the timed call.
+
+        Args:
+            kwargs: The query_cypher arguments
+
+        Returns:
+            Total db hits and the plan's operators, or the error PROFILE raised
+        """
+        query = f"PROFILE {kwargs['query'].lstrip()}"
         try:
-            handler, _ = self.tools.get_tool_handler("query_callers")
-            result = await handler(
-                function_name=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=3,
-                include_paths=True
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            # If no error_code, then 0 results is legitimate (function exists but has no callers)
-            has_error = "error_code" in result
-            metadata = result.get("metadata", {})
-
-            results["S2"] = self.create_result(
-                status="fail" if has_error else "pass",
-                response_time_ms=elapsed,
-                result_count=metadata.get("row_count", 0),
-                performance_target_met=elapsed < 150,
-                notes=f"Multi-level traversal found {metadata.get('row_count', 0)} callers in {elapsed}ms"
-            )
+            plan = self.ingestor.fetch_all(query, kwargs.get("parameters"))
         except Exception as e:
-            self.log_error("S2", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S2"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
-
-        # S3: query_hierarchy - Class inheritance (down)
-        self.log_test("S3", "query_hierarchy - class inheritance descendants")
-        start = time.time()
+            return {"error": str(e)[:100]}
+        return {
+            "db_hits": sum(row.get("ACTUAL HITS", 0) for row in plan),
+            "plan_operators": [row.get("OPERATOR", "") for row in plan],
+        }
+
+    def _load_profile_baseline(self) -> dict[str, int]:
+        """Read the ``STRESS_PROFILE_BASELINE`` db hits file, if one is set."""
+        path = os.getenv("STRESS_PROFILE_BASELINE")
+        if not path:
+            return {}
         try:
-            handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            result = await handler(
-                class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                direction="down",
-                max_depth=5
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.log_error("profile baseline", e)
+            return {}
+
+    def _render_results(self, results: dict[str, StressResult]) -> None:
+        """Fill in each result's ms response time and notes from its raw timing.
+
+        Runs once after every test has finished, so no formatting happens
+        between timed calls. Failed tests keep their error notes. Profiled
+        tests are checked against the baseline's db hits.
+        """
+        baseline = self._load_profile_baseline()
+        for test_id, result in results.items():
+            profile = result.extra.get("profile")
+            if profile and "db_hits" in profile and test_id in baseline:
+                profile["baseline_db_hits"] = baseline[test_id]
+                profile["regressed"] = (
+                    profile["db_hits"] > baseline[test_id] * _DB_HITS_REGRESSION
+                )
+            elapsed = result.extra["elapsed_ns"] // NS_PER_MS
+            result.response_time_ms = elapsed
+            result.extra.setdefault("notes", self._NOTES_FMT[test_id].format(
+                row_count=result.extra["result_count"], elapsed=elapsed
+            ))
 
-            results["S3"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Found {row_count} descendants in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S3", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S3"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+    async def get_test_results(self) -> dict[str, Any]:
+        """Run all structural query tests.
 
-        # S4: query_hierarchy - Class inheritance (up)
-        self.log_test("S4", "query_hierarchy - class inheritance ancestors")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            result = await handler(
-                class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                direction="up",
-                max_depth=5
-            )
-            elapsed = int((time.time() - start) * 1000)
+        Returns:
+            Dictionary mapping test IDs to test results
+        """
+        results = {}
 
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
+        # S1: query_callers - Find function callers (depth 1)
+        results["S1"] = await self._time_tool(
+            "S1", "query_callers - find function callers (depth=1)",
+            "query_callers",
+            {"function_name": self._qn_main, "max_depth": 1, "include_paths": True},
+            _fail_on_error,
+        )
 
-            results["S4"] = self.create_result(
-                status="pass",  # May have 0 ancestors (base class)
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Found {row_count} ancestors in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S4", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S4"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        # S2: query_callers - Multi-level caller traversal (depth 3)
+        results["S2"] = await self._time_tool(
+            "S2", "query_callers - multi-level traversal (depth=3)",
+            "query_callers",
+            {"function_name": self._qn_main, "max_depth": 3, "include_paths": True},
+            _fail_on_error,
+        )
 
-        # S5: query_hierarchy - Bidirectional hierarchy
-        self.log_test("S5", "query_hierarchy - bidirectional traversal")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_hierarchy")
-            result = await handler(
-                class_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                direction="both",
-                max_depth=10
-            )
-            elapsed = int((time.time() - start) * 1000)
+        # S3: query_hierarchy - Class inheritance (down)
+        results["S3"] = await self._time_tool(
+            "S3", "query_hierarchy - class inheritance descendants",
+            "query_hierarchy",
+            {"class_name": self._qn_apierror, "direction": "down", "max_depth": 5},
+            _partial_if_empty,
+        )
 
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
+        # S4: query_hierarchy - Class inheritance (up)
+        results["S4"] = await self._time_tool(
+            "S4", "query_hierarchy - class inheritance ancestors",
+            "query_hierarchy",
+            {"class_name": self._qn_apierror, "direction": "up", "max_depth": 5},
+            _always_pass,
+        )
 
-            results["S5"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 100,
-                notes=f"Bidirectional traversal found {row_count} classes in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S5", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S5"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        # S5: query_hierarchy - Bidirectional hierarchy
+        results["S5"] = await self._time_tool(
+            "S5", "query_hierarchy - bidirectional traversal",
+            "query_hierarchy",
+            {"class_name": self._qn_apierror, "direction": "both", "max_depth": 10},
+            _partial_if_empty,
+        )
 
         # S6: query_dependencies - Module imports
-        self.log_test("S6", "query_dependencies - module imports")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_dependencies")
-            result = await handler(
-                target=f"{self.project_name}.scripts.benchmark.benchmark_models",
-                dependency_type="imports"
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            # If no error_code, then 0 results is legitimate (module exists but has no imports)
-            has_error = "error_code" in result
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S6"] = self.create_result(
-                status="fail" if has_error else "pass",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Found {row_count} import dependencies in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S6", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S6"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S6"] = await self._time_tool(
+            "S6", "query_dependencies - module imports",
+            "query_dependencies",
+            {"target": self._qn_benchmark_models, "dependency_type": "imports"},
+            _fail_on_error,
+        )
 
         # S7: query_dependencies - Function calls
-        self.log_test("S7", "query_dependencies - function calls")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_dependencies")
-            result = await handler(
-                target=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                dependency_type="calls"
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S7"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Found {row_count} call dependencies in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S7", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S7"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S7"] = await self._time_tool(
+            "S7", "query_dependencies - function calls",
+            "query_dependencies",
+            {"target": self._qn_main, "dependency_type": "calls"},
+            _partial_if_empty,
+        )
 
         # S8: query_dependencies - All dependencies
-        self.log_test("S8", "query_dependencies - all dependency types")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_dependencies")
-            result = await handler(
-                target=f"{self.project_name}.scripts.benchmark.benchmark_models",
-                dependency_type="all"
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            # If no error_code, then 0 results is legitimate (module exists but has no dependencies)
-            has_error = "error_code" in result
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S8"] = self.create_result(
-                status="fail" if has_error else "pass",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 100,
-                notes=f"Found {row_count} total dependencies in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S8", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S8"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S8"] = await self._time_tool(
+            "S8", "query_dependencies - all dependency types",
+            "query_dependencies",
+            {"target": self._qn_benchmark_models, "dependency_type": "all"},
+            _fail_on_error,
+        )
 
         # S9: query_implementations - Find implementations
-        self.log_test("S9", "query_implementations - direct implementations")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_implementations")
-            result = await handler(
-                interface_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                include_indirect=False
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S9"] = self.create_result(
-                status="pass",  # May have 0 implementations
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Found {row_count} direct implementations in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S9", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S9"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S9"] = await self._time_tool(
+            "S9", "query_implementations - direct implementations",
+            "query_implementations",
+            {"interface_name": self._qn_apierror, "include_indirect": False},
+            _always_pass,
+        )
 
         # S10: query_implementations - Include indirect implementations
-        self.log_test("S10", "query_implementations - indirect implementations")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_implementations")
-            result = await handler(
-                interface_name=f"{self.project_name}.scripts.benchmark.utils.api_client.APIError",
-                include_indirect=True
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S10"] = self.create_result(
-                status="pass",  # May have 0 implementations
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 100,
-                notes=f"Found {row_count} total implementations (including indirect) in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S10", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S10"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S10"] = await self._time_tool(
+            "S10", "query_implementations - indirect implementations",
+            "query_implementations",
+            {"interface_name": self._qn_apierror, "include_indirect": True},
+            _always_pass,
+        )
 
         # S11: query_module_exports - Public exports only
-        self.log_test("S11", "query_module_exports - public exports")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_module_exports")
-            result = await handler(
-                module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
-                include_private=False
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            has_results = bool(result.get("results"))
-            metadata = result.get("metadata", {})
-
-            results["S11"] = self.create_result(
-                status="pass" if has_results else "partial",
-                response_time_ms=elapsed,
-                result_count=metadata.get("row_count", 0),
-                performance_target_met=elapsed < 50,
-                notes=f"Found {metadata.get('row_count', 0)} public exports in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S11", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S11"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S11"] = await self._time_tool(
+            "S11", "query_module_exports - public exports",
+            "query_module_exports",
+            {"module_name": self._qn_api_client, "include_private": False},
+            _partial_without_results,
+        )
 
         # S12: query_module_exports - Include private exports
-        self.log_test("S12", "query_module_exports - all exports including private")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_module_exports")
-            result = await handler(
-                module_name=f"{self.project_name}.scripts.benchmark.utils.api_client",
-                include_private=True
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            has_results = bool(result.get("results"))
-            metadata = result.get("metadata", {})
-
-            results["S12"] = self.create_result(
-                status="pass" if has_results else "partial",
-                response_time_ms=elapsed,
-                result_count=metadata.get("row_count", 0),
-                performance_target_met=elapsed < 50,
-                notes=f"Found {metadata.get('row_count', 0)} total exports (including private) in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S12", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S12"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S12"] = await self._time_tool(
+            "S12", "query_module_exports - all exports including private",
+            "query_module_exports",
+            {"module_name": self._qn_api_client, "include_private": True},
+            _partial_without_results,
+        )
 
         # S13: query_call_graph - Simple call graph
-        self.log_test("S13", "query_call_graph - simple call graph (depth=2)")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_call_graph")
-            result = await handler(
-                entry_point=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=2,
-                max_nodes=30
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S13"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 100,
-                notes=f"Generated call graph with {row_count} nodes in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S13", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S13"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S13"] = await self._time_tool(
+            "S13", "query_call_graph - simple call graph (depth=2)",
+            "query_call_graph",
+            {"entry_point": self._qn_main, "max_depth": 2, "max_nodes": 30},
+            _partial_if_empty,
+        )
 
         # S14: query_call_graph - Deep call graph
-        self.log_test("S14", "query_call_graph - deep call graph (depth=4)")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_call_graph")
-            result = await handler(
-                entry_point=f"{self.project_name}.scripts.benchmark.benchmark_models.main",
-                max_depth=4,
-                max_nodes=100
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S14"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 300,
-                notes=f"Generated deep call graph with {row_count} nodes in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S14", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S14"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S14"] = await self._time_tool(
+            "S14", "query_call_graph - deep call graph (depth=4)",
+            "query_call_graph",
+            {"entry_point": self._qn_main, "max_depth": 4, "max_nodes": 100},
+            _partial_if_empty,
+        )
 
         # S15: query_cypher - Simple custom query
-        self.log_test("S15", "query_cypher - simple custom query")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query=f"MATCH (p:Project {{name: '{self.project_name}'}})-[:CONTAINS]->(f:Function) RETURN f.qualified_name AS name LIMIT 10",
-                limit=10
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S15"] = self.create_result(
-                status="pass" if row_count > 0 else "partial",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 50,
-                notes=f"Custom Cypher query returned {row_count} results in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S15", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S15"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+        results["S15"] = await self._time_tool(
+            "S15", "query_cypher - simple custom query",
+            "query_cypher",
+            {
+                "query": "MATCH (p:Project {name: $project})-[:CONTAINS]->(f:Function) RETURN f.qualified_name AS name LIMIT 10",
+                "parameters": {"project": self.project_name},
+                "limit": 10,
+            },
+            _partial_if_empty,
+        )
 
         # S16: query_cypher - Complex custom query with joins
-        self.log_test("S16", "query_cypher - complex query with relationships")
-        start = time.time()
-        try:
-            handler, _ = self.tools.get_tool_handler("query_cypher")
-            result = await handler(
-                query=f"""
-                    MATCH (p:Project {{name: '{self.project_name}'}})-[:CONTAINS]->(m:Module)
+        results["S16"] = await self._time_tool(
+            "S16", "query_cypher - complex query with relationships",
+            "query_cypher",
+            {
+                "query": """
+                    MATCH (p:Project {name: $project})-[:CONTAINS]->(m:Module)
                     -[:CONTAINS]->(c:Class)-[:CONTAINS]->(method:Method)
-                    RETURN m.qualified_name AS module, c.name AS class, method.name AS method
+                    WITH m, c, method
                     LIMIT 20
+                    RETURN m.qualified_name AS module, c.name AS class, method.name AS method
                 """,
-                limit=20
-            )
-            elapsed = int((time.time() - start) * 1000)
-
-            # If no error_code, then 0 results is legitimate (query executed successfully, no matching data)
-            has_error = "error_code" in result
-            metadata = result.get("metadata", {})
-            row_count = metadata.get("row_count", 0)
-
-            results["S16"] = self.create_result(
-                status="fail" if has_error else "pass",
-                response_time_ms=elapsed,
-                result_count=row_count,
-                performance_target_met=elapsed < 100,
-                notes=f"Complex Cypher query returned {row_count} results in {elapsed}ms"
-            )
-        except Exception as e:
-            self.log_error("S16", e)
-            elapsed = int((time.time() - start) * 1000)
-            results["S16"] = self.create_result(
-                status="fail",
-                response_time_ms=elapsed,
-                result_count=0,
-                performance_target_met=False,
-                notes=str(e)[:100]
-            )
+                "parameters": {"project": self.project_name},
+                "limit": 20,
+            },
+            _fail_on_error,
+        )
 
+        self._render_results(results)
         return results
@@ -15,14 +15,48 @@ Usage:
 """
 
 import argparse
+import ipaddress
+import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import uvicorn
 from loguru import logger
 
-from weavr.http.config import HttpServerConfig
-from weavr.http.server import create_app
+if TYPE_CHECKING:
+    from weavr.http.config import HttpServerConfig
+
+# A hostname: dot-separated labels of letters, digits, underscores and inner
+# hyphens (underscores show up in container and compose service names)
+_HOSTNAME_RE = re.compile(
+    r"^(?=.{1,253}$)[A-Za-z0-9_](?:[A-Za-z0-9_-]{0,61}[A-Za-z0-9_])?"
+    r"(?:\.[A-Za-z0-9_](?:[A-Za-z0-9_-]{0,61}[A-Za-z0-9_])?)*$"
+)
+
+
+def _port(value: str) -> int:
+    """argparse type for --port: an integer in ServiceConfig's 1024-65535 range."""
+    try:
+        port = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port: {value!r}") from None
+    if not 1024 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"port must be 1024-65535, got {port}")
+    return port
+
+
+def _host(value: str) -> str:
+    """argparse type for --host: an IP address or a hostname.
+
+    A name whose last label is all digits is rejected, since it can only be a
+    malformed address such as ``999.999.999.999``.
+    """
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        if not _HOSTNAME_RE.match(value) or value.rsplit(".", 1)[-1].isdigit():
+            raise argparse.ArgumentTypeError(f"invalid host: {value!r}") from None
+    return value
 
 
 def parse_args() -> argparse.Namespace:
@@ -52,14 +86,14 @@ Examples:
 
     parser.add_argument(
         "--host",
-        type=str,
+        type=_host,
         default=None,
         help="Host address to bind to (overrides config file). Default: 127.0.0.1",
     )
 
     parser.add_argument(
         "--port",
-        type=int,
+        type=_port,
         default=None,
         help="Port to listen on (overrides config file). Default: 8001",
     )
@@ -88,7 +122,7 @@ Examples:
     return parser.parse_args()
 
 
-def load_configuration(args: argparse.Namespace) -> HttpServerConfig:
+def load_configuration(args: argparse.Namespace) -> "HttpServerConfig":
     """Load and validate configuration from file and CLI arguments.
 
     CLI arguments override values from the configuration file.
@@ -103,6 +137,8 @@ def load_configuration(args: argparse.Namespace) -> HttpServerConfig:
         FileNotFoundError: If specified config file doesn't exist
         ValueError: If configuration validation fails
     """
+    from weavr.http.config import HttpServerConfig, ServiceConfig
+
     # T040: Load configuration from YAML file
     config_path = Path(args.config) if args.config else None
 
@@ -131,22 +167,28 @@ def load_configuration(args: argparse.Namespace) -> HttpServerConfig:
         sys.exit(1)
 
     # T039: Apply CLI argument overrides (CLI args take precedence over config file)
+    service_overrides: dict[str, Any] = {}
     if args.host is not None:
         logger.info(f"Overriding host from CLI: {args.host}")
-        config.service.host = args.host
+        service_overrides["host"] = args.host
 
     if args.port is not None:
         logger.info(f"Overriding port from CLI: {args.port}")
-        config.service.port = args.port
+        service_overrides["port"] = args.port
 
     # T041: Validate final configuration
-    try:
-        # Trigger Pydantic validation by creating a new instance with the updated values
-        config = HttpServerConfig(**config.model_dump())
-    except Exception as e:
-        logger.error(f"Configuration validation failed after applying CLI overrides: {e}")
-        logger.error("Please check that your --host and --port values are valid")
-        sys.exit(1)
+    if service_overrides:
+        try:
+            # Only the service section changed; the rest was validated on load
+            service = ServiceConfig.model_validate(
+                {**config.service.model_dump(), **service_overrides}
+            )
+        except Exception as e:
+            logger.error(f"Configuration validation failed after applying CLI overrides: {e}")
+            logger.error("Please check that your --host and --port values are valid")
+            sys.exit(1)
+        # Swap in the new section without validating the unchanged ones again
+        config = config.model_copy(update={"service": service})
 
     return config
 
@@ -165,6 +207,11 @@ def main() -> None:
     # T039: Parse command-line arguments
     args = parse_args()
 
+    # Server imports are heavy, so --help and argument errors don't pay for them
+    import uvicorn
+
+    from weavr.http.server import create_app
+
     # Configure logging
     logger.remove()  # Remove default handler
     logger.add(
@@ -176,32 +223,32 @@ def main() -> None:
     # T040, T041: Load and validate configuration
     config = load_configuration(args)
 
-    # T043: Display startup information
-    logger.info("=" * 80)
-    logger.info("Code Graph RAG HTTP Server")
-    logger.info("=" * 80)
-    logger.info(f"Service:  {config.service.name}")
-    logger.info(f"Version:  0.0.24")
-    logger.info(f"Host:     {config.service.host}")
-    logger.info(f"Port:     {config.service.port}")
-    logger.info(f"Workers:  {config.server.workers}")
-    logger.info(f"Timeout:  {config.server.timeout}s")
-    logger.info(f"Reload:   {args.reload}")
-    logger.info("=" * 80)
-    logger.info(f"Configuration loaded:")
-    logger.info(f"  - CORS enabled: {config.security.cors.enabled}")
-    logger.info(
-        f"  - Allowed origins: {', '.join(config.security.cors.allowed_origins)}"
-    )
-    logger.info(
-        f"  - Health check interval: {config.monitoring.health_check_interval}s"
-    )
-    logger.info(f"  - Memgraph: {config.dependencies.memgraph.host}:{config.dependencies.memgraph.port}")
-    logger.info(f"  - Graceful shutdown: {config.server.graceful_shutdown_seconds}s")
-    logger.info("=" * 80)
-    logger.info(f"Starting server on http://{config.service.host}:{config.service.port}")
-    logger.info("Press Ctrl+C to stop")
-    logger.info("=" * 80)
+    # T043: Display startup information, as one log record
+    rule = "=" * 80
+    memgraph = config.dependencies.memgraph
+    logger.info("\n".join([
+        rule,
+        "Code Graph RAG HTTP Server",
+        rule,
+        f"Service:  {config.service.name}",
+        "Version:  0.0.24",
+        f"Host:     {config.service.host}",
+        f"Port:     {config.service.port}",
+        f"Workers:  {config.server.workers}",
+        f"Timeout:  {config.server.timeout}s",
+        f"Reload:   {args.reload}",
+        rule,
+        "Configuration loaded:",
+        f"  - CORS enabled: {config.security.cors.enabled}",
+        f"  - Allowed origins: {', '.join(config.security.cors.allowed_origins)}",
+        f"  - Health check interval: {config.monitoring.health_check_interval}s",
+        f"  - Memgraph: {memgraph.host}:{memgraph.port}",
+        f"  - Graceful shutdown: {config.server.graceful_shutdown_seconds}s",
+        rule,
+        f"Starting server on http://{config.service.host}:{config.service.port}",
+        "Press Ctrl+C to stop",
+        rule,
+    ]))
 
     # Create FastAPI app with loaded configuration
     app = create_app(config)
@@ -1,10 +1,97 @@
 """HTTP server configuration models."""
 
+import functools
+import json
+import os
+import re
 from pathlib import Path
 from typing import Any, Optional
 
+import yaml
+from loguru import logger
 from pydantic import BaseModel, Field, ValidationError, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+    HAS_LIBYAML = False
+    logger.warning(
+        "PyYAML was built without libyaml; config files use the slower pure-Python "
+        "loader. Install libyaml-dev and reinstall PyYAML for the C loader."
+    )
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Service names: a lowercase letter, then lowercase letters, digits and hyphens
+_SERVICE_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*$")
+
+
+# Compiled artifacts are only written next to the repo's own config files
+_CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+def compiled_config_path(config_path: Path) -> Path:
+    """Return the JSON artifact path for a YAML config, e.g. ``x.compiled.json``."""
+    return config_path.with_suffix(".compiled.json")
+
+
+def load_compiled(path: Path) -> Any:
+    """Load a compiled JSON config artifact."""
+    data = path.read_bytes()
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _write_compiled(path: Path, artifact: dict[str, Any]) -> None:
+    """Write ``artifact`` as a compiled JSON file, replacing it atomically.
+
+    Failures are logged and ignored; the YAML file stays the source of truth.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        if HAS_ORJSON:
+            tmp_path.write_bytes(orjson.dumps(artifact))
+        else:
+            tmp_path.write_text(json.dumps(artifact), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(f"Could not write compiled config {path}: {e}")
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Read a YAML config, cached by path, modification time and size.
+
+    A compiled JSON artifact recording exactly this modification time and size
+    is read instead; otherwise the YAML is parsed and, for files in the repo's
+    ``config/`` directory, the artifact rewritten. The result is shared between
+    callers, so it must not be changed.
+    """
+    source = {"mtime_ns": mtime_ns, "size": size}
+    compiled = compiled_config_path(Path(path))
+    try:
+        artifact = load_compiled(compiled)
+        if artifact.get("source") == source:
+            return artifact["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    with open(path) as f:
+        config_data = yaml.load(f, Loader=YamlLoader)
+    if Path(path).parent == _CONFIG_DIR:
+        _write_compiled(compiled, {"source": source, "data": config_data})
+    return config_data
 
 
 class ServiceConfig(BaseModel):
@@ -18,9 +105,7 @@ class ServiceConfig(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate service name follows lowercase-with-hyphens pattern."""
-        import re
-
-        if not re.match(r"^[a-z][a-z0-9-]*$", v):
+        if not _SERVICE_NAME_RE.match(v):
             raise ValueError(
                 "Service name must start with lowercase letter and contain only lowercase letters, digits, and hyphens"
             )
@@ -131,6 +216,18 @@ class HttpServerConfig(BaseSettings):
         extra="ignore",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Give environment variables precedence over the YAML values passed in."""
+        return env_settings, init_settings, dotenv_settings, file_secret_settings
+
     @classmethod
     def load_from_file(cls, config_path: Optional[Path] = None) -> "HttpServerConfig":
         """Load configuration from YAML file with environment variable overrides.
@@ -145,9 +242,6 @@ class HttpServerConfig(BaseSettings):
             FileNotFoundError: If config file doesn't exist
             ValueError: If config validation fails with detailed error messages
         """
-        import os
-        import yaml
-
         # Determine config path
         if config_path is None:
             config_path = Path("config/http-server.yaml")
@@ -160,10 +254,12 @@ class HttpServerConfig(BaseSettings):
                 f"Please create the configuration file or specify a different path."
             )
 
-        # Load and parse YAML
+        # Load and parse YAML; a changed file has a new mtime or size, so a new key
+        stat = config_path.stat()
         try:
-            with open(config_path) as f:
-                config_data = yaml.safe_load(f)
+            config_data = _read_config_file(
+                str(config_path.resolve()), stat.st_mtime_ns, stat.st_size
+            )
         except yaml.YAMLError as e:
             raise ValueError(
                 f"Invalid YAML syntax in configuration file: {config_path}\n"
@@ -171,42 +267,8 @@ class HttpServerConfig(BaseSettings):
                 f"Please check the YAML syntax at the location indicated above."
             ) from e
 
-        # Apply environment variable overrides manually
-        # This is more reliable than relying on pydantic-settings auto-loading
-        def apply_env_overrides(data: dict[str, Any], prefix: str = "HTTP_SERVER") -> dict[str, Any]:
-            """Recursively apply environment variable overrides to config data."""
-            for key, value in data.items():
-                env_key = f"{prefix}__{key.upper()}"
-
-                if isinstance(value, dict):
-                    # Recursively apply to nested dicts
-                    apply_env_overrides(value, env_key)
-                else:
-                    # Check for environment variable override
-                    env_value = os.environ.get(env_key)
-                    if env_value is not None:
-                        # Convert string to appropriate type
-                        if isinstance(value, bool):
-                            data[key] = env_value.lower() in ('true', '1', 'yes', 'on')
-                        elif isinstance(value, int):
-                            data[key] = int(env_value)
-                        elif isinstance(value, list):
-                            # Support JSON array format for lists
-                            import json
-                            try:
-                                data[key] = json.loads(env_value)
-                            except json.JSONDecodeError:
-                                # Fall back to comma-separated values
-                                data[key] = [s.strip() for s in env_value.split(',')]
-                        else:
-                            data[key] = env_value
-
-            return data
-
-        # Apply environment overrides
-        config_data = apply_env_overrides(config_data)
-
-        # Validate and create config instance
+        # Validate and create config instance; pydantic-settings merges in the
+        # HTTP_SERVER__* environment overrides (see settings_customise_sources)
         try:
             return cls(**config_data)
         except ValidationError as e:
@@ -1,14 +1,17 @@
 """Health check functionality for HTTP server."""
 
 import asyncio
+import threading
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import mgclient
 from loguru import logger
 
 from weavr.http.models import DependencyStatus, HealthStatus
 
+if TYPE_CHECKING:
+    import mgclient
+
 
 class HealthChecker:
     """Manages health checks for service dependencies with background monitoring."""
@@ -20,6 +23,7 @@ class HealthChecker:
         memgraph_host: str = "localhost",
         memgraph_port: int = 7687,
         check_interval: int = 30,
+        memgraph_timeout_ms: int = 1000,
     ) -> None:
         """Initialize health checker.
 
@@ -29,53 +33,137 @@ class HealthChecker:
             memgraph_host: Memgraph server host
             memgraph_port: Memgraph server port
             check_interval: Seconds between background health checks
+            memgraph_timeout_ms: Milliseconds a Memgraph check may take before it
+                is reported unavailable
         """
         self.service_name = service_name
         self.version = version
         self.memgraph_host = memgraph_host
         self.memgraph_port = memgraph_port
         self.check_interval = check_interval
-        self.start_time = time.time()
+        self.memgraph_timeout_ms = memgraph_timeout_ms
+        self.start_time = time.monotonic()
         self._cached_status: Optional[HealthStatus] = None
         self._background_task: Optional[asyncio.Task[None]] = None
         self._running = False
+        # Kept open between checks; dropped after a failure so the next reconnects
+        self._conn: Optional["mgclient.Connection"] = None
+        # Checks run in a worker thread; the lock keeps stop() from closing mid-query.
+        # A hung check keeps holding it, so it is never waited on without a bound
+        self._conn_lock = threading.Lock()
 
     def get_uptime_seconds(self) -> int:
         """Get service uptime in seconds."""
-        return int(time.time() - self.start_time)
+        return int(time.monotonic() - self.start_time)
 
     async def check_memgraph(self) -> DependencyStatus:
         """Check Memgraph connectivity and measure latency.
 
+        The blocking mgclient calls run in a worker thread so the event loop
+        keeps serving requests meanwhile, and a check that outlasts
+        ``memgraph_timeout_ms`` is reported unavailable.
+
         Returns:
             DependencyStatus with connection status and latency
         """
-        start_time = time.time()
         try:
-            # Create connection and execute simple query
-            conn = mgclient.connect(host=self.memgraph_host, port=self.memgraph_port)
-            try:
-                cursor = conn.cursor()
-                cursor.execute("RETURN 1")
-                cursor.fetchall()
-                cursor.close()
-
-                # Calculate latency in milliseconds
-                latency_ms = int((time.time() - start_time) * 1000)
-
-                return DependencyStatus(
-                    status="connected",
-                    latency_ms=latency_ms,
-                )
-            finally:
-                conn.close()
-
-        except Exception as e:
-            logger.warning(f"Memgraph health check failed: {e}")
+            async with asyncio.timeout(self.memgraph_timeout_ms / 1000):
+                return await asyncio.to_thread(self._check_memgraph_sync)
+        except TimeoutError:
+            logger.warning(
+                f"Memgraph health check timed out after {self.memgraph_timeout_ms}ms"
+            )
+            return DependencyStatus(
+                status="unavailable",
+                error="timeout",
+            )
+
+    def _check_memgraph_sync(self) -> DependencyStatus:
+        """Blocking body of ``check_memgraph``, run in a worker thread."""
+        if not self._conn_lock.acquire(blocking=False):
+            logger.warning(
+                "Memgraph health check skipped: previous check still running"
+            )
             return DependencyStatus(
                 status="unavailable",
-                error=str(e),
+                error="previous check still running",
+            )
+        try:
+            reused = self._conn is not None
+            try:
+                latency_ms = self._ping_memgraph()
+            except Exception as e:
+                self._drop_connection()
+                if not reused:
+                    return self._memgraph_unavailable(e)
+                # The kept connection may be stale (e.g. Memgraph restarted), so
+                # retry once on a fresh one before reporting Memgraph as down
+                logger.debug(f"Reconnecting to Memgraph after: {e}")
+                try:
+                    latency_ms = self._ping_memgraph()
+                except Exception as e:
+                    self._drop_connection()
+                    return self._memgraph_unavailable(e)
+
+            return DependencyStatus(
+                status="connected",
+                latency_ms=latency_ms,
+            )
+        finally:
+            self._conn_lock.release()
+
+    def _memgraph_unavailable(self, error: Exception) -> DependencyStatus:
+        logger.warning(f"Memgraph health check failed: {error}")
+        return DependencyStatus(
+            status="unavailable",
+            error=str(error),
+        )
+
+    def _ping_memgraph(self) -> int:
+        """Run ``RETURN 1``, connecting first if needed, and return its latency in ms.
+
+        Latency covers the query only, not connecting.
+        """
+        import mgclient
+
+        if self._conn is None:
+            self._conn = mgclient.connect(
+                host=self.memgraph_host, port=self.memgraph_port
+            )
+            self._conn.autocommit = True
+
+        start_time = time.perf_counter()
+        cursor = self._conn.cursor()
+        cursor.execute("RETURN 1")
+        cursor.fetchall()
+        cursor.close()
+        return int((time.perf_counter() - start_time) * 1000)
+
+    def _close_connection(self) -> None:
+        """Close the Memgraph connection once no check is using it.
+
+        If a hung check still holds it after ``memgraph_timeout_ms``, the
+        connection is abandoned to that check instead of waiting forever.
+        """
+        if not self._conn_lock.acquire(timeout=self.memgraph_timeout_ms / 1000):
+            logger.warning(
+                "Memgraph health check still running; abandoning its connection"
             )
+            return
+        try:
+            self._drop_connection()
+        finally:
+            self._conn_lock.release()
+
+    def _drop_connection(self) -> None:
+        """Close and forget the Memgraph connection, ignoring close errors."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
 
     async def check_health(self) -> HealthStatus:
         """Check health of all dependencies and return overall status.
@@ -160,6 +248,10 @@ class HealthChecker:
                 pass
             self._background_task = None
 
+        # A cancelled check may still hold the lock in its thread; wait (bounded)
+        # off the loop
+        await asyncio.to_thread(self._close_connection)
+
     def get_cached_status(self) -> HealthStatus:
         """Get the most recent cached health status.
 
@@ -141,6 +141,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             memgraph_host=_config.dependencies.memgraph.host,
             memgraph_port=_config.dependencies.memgraph.port,
             check_interval=_config.monitoring.health_check_interval,
+            memgraph_timeout_ms=_config.dependencies.memgraph.timeout,
         )
     else:
         _health_checker = HealthChecker(
@@ -0,0 +1,62 @@
+"""Tests for the expert-mode Cypher bracket pre-check."""
+
+import pytest
+
+from weavr.tools.structural_queries import ExpertModeQuery, _brackets_balanced
+
+
+class TestBracketsBalanced:
+    """Brackets in strings, identifiers and comments must not count."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n:Function) WHERE n.name = 'parse(' RETURN n LIMIT 5",
+            'MATCH (n:Function) WHERE n.name = "[x" RETURN n LIMIT 5',
+            r"MATCH (n) WHERE n.doc = 'it\'s {open' RETURN n",
+            r'MATCH (n) WHERE n.doc = "say \"(\" twice" RETURN n',
+            "MATCH (n) WHERE n.doc = 'a \"(\" b' RETURN n",
+            "MATCH (n) RETURN n.name AS `odd ) name` LIMIT 1",
+            "MATCH (`weird [label`) RETURN 1",
+            "MATCH (n) // pick (first\nRETURN n",
+            "MATCH (n) /* ) */ RETURN n",
+            "MATCH (n)\n/* multi\n [ line */ RETURN n",
+            "MATCH (n {url: 'http://x/(a'}) RETURN n",
+            "MATCH (n) RETURN '/* (' AS s, n",
+        ],
+    )
+    def test_ignored_brackets_are_balanced(self, query: str) -> None:
+        assert _brackets_balanced(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n RETURN n",
+            "MATCH (n)-[r:CALLS->(m) RETURN m",
+            "MATCH (n {name: 'x') RETURN n",
+            "MATCH (n)) RETURN n",
+            "MATCH (n) RETURN [n.name)",
+            "MATCH (n) WHERE n.name = '(' RETURN (n",
+            "MATCH (n) // (\nRETURN n)",
+        ],
+    )
+    def test_unbalanced_brackets_are_caught(self, query: str) -> None:
+        assert not _brackets_balanced(query)
+
+
+class TestExpertModeValidation:
+    """The pre-check as wired into ExpertModeQuery._validate_cypher_query."""
+
+    def test_valid_query_passes(self) -> None:
+        query = (
+            "MATCH (f:Function)-[:CALLS]->(g:Function) "
+            "WHERE f.name = 'main' // entry point (\n"
+            "RETURN {caller: f.qualified_name, callees: collect(g.name)[..5]} "
+            "AS calls LIMIT 10"
+        )
+        assert ExpertModeQuery()._validate_cypher_query(query) is None
+
+    def test_unbalanced_query_is_rejected(self) -> None:
+        error = ExpertModeQuery()._validate_cypher_query("MATCH (n RETURN n LIMIT 1")
+        assert error is not None
+        assert error["error_code"] == "INVALID_QUERY"
@@ -9,6 +9,7 @@ This module provides pre-built structural query tools for exploring code relatio
 - Expert mode Cypher queries
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -661,9 +662,7 @@ class DependencyAnalysisQuery(StructuralQueryTool):
             # Check if target exists if no results
             if not imports and not calls:
                 check_query = """
-                MATCH (n)
-                WHERE n.qualified_name = $name
-                  AND (n:Module OR n:Function OR n:Method OR n:Class)
+                MATCH (n:Module|Function|Method|Class {qualified_name: $name})
                 RETURN n.qualified_name, labels(n) AS type
                 """
                 exists = ingestor.fetch_all(check_query, {"name": target})
@@ -720,10 +719,8 @@ class DependencyAnalysisQuery(StructuralQueryTool):
         if include_transitive:
             # Multi-hop import dependencies (use cautiously)
             query = """
-            MATCH path = (source)-[:IMPORTS*1..3]->(imported)
-            WHERE source.qualified_name = $target
-              AND (source:Module OR source:Function OR source:Method)
-              AND (imported:Module OR imported:ExternalPackage)
+            MATCH path = (source:Module|Function|Method {qualified_name: $target})
+                         -[:IMPORTS*1..3]->(imported:Module|ExternalPackage)
             RETURN
                 imported.qualified_name AS dependency_name,
                 labels(imported) AS dependency_type,
@@ -736,10 +733,8 @@ class DependencyAnalysisQuery(StructuralQueryTool):
         else:
             # Direct imports only
             query = """
-            MATCH (source)-[:IMPORTS]->(imported)
-            WHERE source.qualified_name = $target
-              AND (source:Module OR source:Function OR source:Method)
-              AND (imported:Module OR imported:ExternalPackage)
+            MATCH (source:Module|Function|Method {qualified_name: $target})
+                  -[:IMPORTS]->(imported:Module|ExternalPackage)
             RETURN
                 imported.qualified_name AS dependency_name,
                 labels(imported) AS dependency_type,
@@ -1338,6 +1333,26 @@ LIMIT 20;
 ```
 """
 
+# String literals, backtick-quoted names and comments, blanked out before bracket
+# matching; one alternation so comment markers inside strings stay literal
+_CYPHER_QUOTED_RE = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`"
+    r"|//[^\n]*|/\*[\s\S]*?(?:\*/|\Z)"
+)
+_CYPHER_BRACKETS = {")": "(", "]": "[", "}": "{"}
+
+
+def _brackets_balanced(query: str) -> bool:
+    """Check (), [] and {} outside strings and comments open and close in order."""
+    stack: list[str] = []
+    for char in _CYPHER_QUOTED_RE.sub("", query):
+        if char in "([{":
+            stack.append(char)
+        elif char in _CYPHER_BRACKETS:
+            if not stack or stack.pop() != _CYPHER_BRACKETS[char]:
+                return False
+    return not stack
+
 
 @dataclass
 class ExpertModeQuery(StructuralQueryTool):
@@ -1495,6 +1510,15 @@ class ExpertModeQuery(StructuralQueryTool):
                 provided_input={"query": query[:100]},
             )
 
+        # Catch unbalanced brackets here rather than via a server parse error
+        if not _brackets_balanced(query):
+            return create_error_response(
+                error_type="INVALID_QUERY",
+                message="Query has unbalanced brackets",
+                suggestion="Check that every (, [ and { in the query is closed.",
+                provided_input={"query": query[:100]},
+            )
+
         return None  # Valid query
 
     def get_schema_documentation(self) -> str: